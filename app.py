@@ -2,10 +2,10 @@
 스마트한 쇼핑 앱 - LangGraph 버전
 """
 import streamlit as st
-from config.settings import configure_page, initialize_session_state
+from config.settings import configure_page, initialize_session_state, WORKFLOW_SETTINGS
 from components.ui import render_header, render_sidebar, render_search_section
-from components.visualizations import display_results
-from core.workflow import create_search_workflow
+from components.visualizations import display_results, display_partial_results
+from core.workflow import create_search_workflow, stream_search
 from utils.helpers import ensure_font
 
 # 페이지 설정
@@ -45,11 +45,24 @@ if search_button and search_term:
         "pros": [],
         "cons": [],
         "sources": [],
+        "pros_support": [],
+        "cons_support": [],
         "messages": [],
         "error": ""
     }
     
-    final_state = search_app.invoke(initial_state)
+    if WORKFLOW_SETTINGS["stream_results"]:
+        # 포스트별 중간 결과를 먼저 보여주고 최종 결과로 교체
+        partial_placeholder = st.empty()
+        for event in stream_search(search_app, initial_state):
+            if event.get("final"):
+                final_state = event["state"]
+            elif event["pros"] or event["cons"]:
+                loading_placeholder.empty()
+                display_partial_results(partial_placeholder, event)
+        partial_placeholder.empty()
+    else:
+        final_state = search_app.invoke(initial_state)
     loading_placeholder.empty()
     
     # 결과 표시
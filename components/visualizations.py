@@ -5,11 +5,16 @@ import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
 from collections import Counter
+from concurrent.futures import BrokenExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 import re
+import hashlib
 import io
+import json
 import os
 from wordcloud import WordCloud
-import matplotlib.pyplot as plt
+from config.settings import RENDER_SETTINGS, WORDCLOUD_SETTINGS, WORDCLOUD_CACHE_SETTINGS
+from utils.cache import DiskCache, TTLCache
 from utils.helpers import extract_keywords, generate_coupang_search_link, get_sample_coupang_product
 
 def create_pros_cons_chart(pros_count, cons_count):
@@ -51,75 +56,163 @@ def create_pros_cons_chart(pros_count, cons_count):
     
     return fig
 
-def create_wordcloud(texts, title, color_scheme):
-    """워드클라우드 생성"""
+def find_font_path():
+    """한글 폰트 경로 (프로젝트 루트의 폰트 파일 우선)"""
+    font_paths = [
+        "./NanumGothic.ttf",
+        "NanumGothic.ttf",
+        "./fonts/NanumGothic.ttf",
+        "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+        "C:/Windows/Fonts/malgun.ttf",
+        "/System/Library/Fonts/AppleSDGothicNeo.ttc"
+    ]
+    
+    for path in font_paths:
+        if os.path.exists(path):
+            return path
+    return None
+
+@st.cache_resource
+def get_wordcloud_cache():
+    """렌더링된 워드클라우드 PNG 캐시 (메모리 LRU + 선택적 디스크)"""
+    if WORDCLOUD_CACHE_SETTINGS["disk"]:
+        return DiskCache(
+            WORDCLOUD_CACHE_SETTINGS["directory"],
+            ttl=WORDCLOUD_CACHE_SETTINGS["ttl"],
+            max_bytes=WORDCLOUD_CACHE_SETTINGS["max_bytes"],
+            memory_items=WORDCLOUD_CACHE_SETTINGS["memory_items"]
+        )
+    return TTLCache(
+        max_items=WORDCLOUD_CACHE_SETTINGS["memory_items"],
+        ttl=WORDCLOUD_CACHE_SETTINGS["ttl"]
+    )
+
+def wordcloud_cache_key(frequencies, color_scheme, font_path, size):
+    """(키워드 빈도 해시, 색상, 크기/형식, 폰트) 캐시 키"""
+    freq_hash = hashlib.sha1(
+        json.dumps(sorted(frequencies.items()), ensure_ascii=False).encode('utf-8')
+    ).hexdigest()
+    return ('wordcloud', freq_hash, color_scheme, size, font_path)
+
+def render_wordcloud(top_keywords, color_scheme, font_path, width=800, height=400, scale=2,
+                     image_format="PNG", quality=90):
+    """키워드 빈도로 워드클라우드를 그려 이미지 바이트로 반환
+    
+    pyplot 을 거치지 않고 WordCloud 이미지를 바로 인코딩하므로 세션 간 전역 상태를 공유하지 않습니다.
+    """
+    wordcloud = WordCloud(
+        width=width,
+        height=height,
+        scale=scale,
+        background_color='white',
+        colormap=color_scheme,
+        font_path=font_path,
+        relative_scaling=0.7,
+        min_font_size=14,
+        max_words=30,
+        prefer_horizontal=0.8,
+        margin=15,
+        collocations=False
+    ).generate_from_frequencies(top_keywords)
+    
+    buf = io.BytesIO()
+    if image_format.upper() == "WEBP":
+        wordcloud.to_image().save(buf, format='WEBP', quality=quality)
+    else:
+        wordcloud.to_image().save(buf, format='PNG', optimize=False)
+    return buf.getvalue()
+
+@st.cache_resource
+def get_render_pool():
+    """워드클라우드 렌더링 스레드 풀
+
+    pyplot 없이 WordCloud/PIL 로만 그리므로 스레드 간 공유 상태가 없습니다.
+    프로세스 풀(spawn)은 Streamlit 이 __main__ 으로 실행한 app.py 를 자식마다 다시 실행하므로 쓰지 않습니다.
+    """
+    return ThreadPoolExecutor(max_workers=RENDER_SETTINGS["max_workers"], thread_name_prefix="wordcloud")
+
+def submit_wordcloud(texts, color_scheme, pool=None):
+    """워드클라우드 렌더링 시작 후 결과를 꺼내는 함수 반환
+    
+    캐시에 있으면 바로, pool 이 있으면 풀에서, 없으면 꺼낼 때 직접 그립니다.
+    반환된 함수는 PNG/WEBP 바이트 (실패 시 None) 를 돌려주며 메인 스레드에서 호출해야 합니다.
+    """
     if not texts:
-        return None
+        return lambda: None
     
     # 키워드 추출
     word_freq = extract_keywords(texts)
     
     if not word_freq:
-        return None
+        return lambda: None
     
     # 빈도수 기준으로 상위 키워드만 선택 (최대 40개)
-    top_keywords = dict(sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:40])
-    
-    # 프로젝트 루트의 폰트 파일 우선 사용
-    font_path = "./NanumGothic.ttf"
-    
-    # 폰트 파일이 없는 경우 다른 경로 시도
-    if not os.path.exists(font_path):
-        font_paths = [
-            "NanumGothic.ttf",
-            "./fonts/NanumGothic.ttf",
-            "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
-            "C:/Windows/Fonts/malgun.ttf",
-            "/System/Library/Fonts/AppleSDGothicNeo.ttc"
-        ]
-        
-        for path in font_paths:
-            if os.path.exists(path):
-                font_path = path
-                break
+    top_keywords = dict(word_freq.most_common(40))
+    
+    font_path = find_font_path()
+    if not font_path:
+        st.warning(f"한글 폰트를 찾을 수 없습니다. NanumGothic.ttf 파일을 프로젝트 루트에 추가해주세요.")
+        return lambda: None
     
-    # 워드클라우드 생성
-    plt.figure(figsize=(10, 6), facecolor='white')
+    settings = WORDCLOUD_SETTINGS
+    cache = get_wordcloud_cache()
+    cache_key = wordcloud_cache_key(
+        top_keywords, color_scheme, font_path,
+        (settings["width"], settings["height"], settings["scale"], settings["format"], settings["quality"])
+    )
+    image = cache.get(cache_key)
+    if image is not None:
+        return lambda: image
     
-    if font_path and os.path.exists(font_path) and top_keywords:
+    args = (
+        top_keywords, color_scheme, font_path,
+        settings["width"], settings["height"], settings["scale"],
+        settings["format"], settings["quality"]
+    )
+    future = None
+    if pool is not None:
         try:
-            wordcloud = WordCloud(
-                width=800,
-                height=400,
-                background_color='white',
-                colormap=color_scheme,
-                font_path=font_path,
-                relative_scaling=0.7,
-                min_font_size=14,
-                max_words=30,
-                prefer_horizontal=0.8,
-                margin=15,
-                collocations=False
-            ).generate_from_frequencies(top_keywords)
-            
-            plt.imshow(wordcloud, interpolation='bilinear')
-            plt.axis('off')
-            plt.tight_layout(pad=0)
-            
-            buf = io.BytesIO()
-            plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', facecolor='white', edgecolor='none')
-            buf.seek(0)
-            plt.close()
-            
-            return buf
-            
+            future = pool.submit(render_wordcloud, *args)
+        except (BrokenExecutor, RuntimeError) as e:
+            print(f"워드클라우드 풀 오류, 직접 렌더링: {str(e)[:100]}")
+    
+    def result():
+        try:
+            try:
+                rendered = future.result(timeout=RENDER_SETTINGS["timeout"]) if future is not None else render_wordcloud(*args)
+            except (BrokenExecutor, FuturesTimeoutError) as e:
+                print(f"워드클라우드 풀 렌더링 실패, 직접 렌더링: {type(e).__name__}")
+                if future is not None:
+                    future.cancel()
+                rendered = render_wordcloud(*args)
         except Exception as e:
-            plt.close()
             st.error(f"워드클라우드 생성 오류: {str(e)}")
             return None
-    else:
-        st.warning(f"한글 폰트를 찾을 수 없습니다. NanumGothic.ttf 파일을 프로젝트 루트에 추가해주세요.")
-        return None
+        cache.set(cache_key, rendered)
+        return rendered
+    
+    return result
+
+def create_wordcloud(texts, title, color_scheme):
+    """워드클라우드 생성 (PNG/WEBP 바이트, 같은 입력은 캐시에서 반환)"""
+    return submit_wordcloud(texts, color_scheme)()
+
+def compute_visuals(pros, cons):
+    """장점/단점 워드클라우드와 비교 차트를 동시에 계산
+    
+    워드클라우드 두 개는 렌더링 풀에서, 비교 차트는 그동안 현재 스레드에서 만들므로
+    전체 시간은 셋의 합이 아니라 가장 느린 작업 정도가 됩니다.
+    """
+    pool = get_render_pool()
+    pros_wordcloud = submit_wordcloud(pros, "Greens", pool)
+    cons_wordcloud = submit_wordcloud(cons, "Reds", pool)
+    comparison_chart = create_comparison_chart(pros, cons)
+    
+    return {
+        "pros_wordcloud": pros_wordcloud(),
+        "cons_wordcloud": cons_wordcloud(),
+        "comparison_chart": comparison_chart
+    }
 
 def create_text_cloud(texts, title, color):
     """워드클라우드 대신 텍스트 기반 시각화"""
@@ -162,8 +255,11 @@ def create_text_cloud(texts, title, color):
     </div>
     """, unsafe_allow_html=True)
 
-def display_wordclouds(pros, cons):
-    """장단점 워드클라우드 표시"""
+def display_wordclouds(pros, cons, visuals=None):
+    """장단점 워드클라우드 표시 (visuals: compute_visuals 결과, 없으면 여기서 계산)"""
+    if visuals is None:
+        visuals = compute_visuals(pros, cons)
+    
     col1, col2 = st.columns(2)
     
     with col1:
@@ -176,7 +272,7 @@ def display_wordclouds(pros, cons):
             </div>
             """, unsafe_allow_html=True)
             
-            pros_wordcloud = create_wordcloud(pros, "", "Greens")
+            pros_wordcloud = visuals["pros_wordcloud"]
             if pros_wordcloud:
                 st.image(pros_wordcloud, use_container_width=True)
             else:
@@ -201,7 +297,7 @@ def display_wordclouds(pros, cons):
             </div>
             """, unsafe_allow_html=True)
             
-            cons_wordcloud = create_wordcloud(cons, "", "Reds")
+            cons_wordcloud = visuals["cons_wordcloud"]
             if cons_wordcloud:
                 st.image(cons_wordcloud, use_container_width=True)
             else:
@@ -318,6 +414,56 @@ def create_comparison_chart(pros, cons):
     
     return fig, category_pros, category_cons, categories
 
+def support_badge(supports, index, color):
+    """여러 출처에서 언급된 항목에 출처 수 표시"""
+    if index >= len(supports) or supports[index] < 2:
+        return ""
+    return (
+        f' <span style="font-size: 0.8rem; color: {color}; border: 1px solid {color}; '
+        f'border-radius: 10px; padding: 0 0.4rem; margin-left: 0.3rem;">{supports[index]}개 출처</span>'
+    )
+
+def display_point_items(points, kind, supports=None):
+    """장점/단점 항목 목록 표시 (kind: 'pros' 또는 'cons')
+    
+    중간 결과와 최종 결과가 같은 마크업을 쓰도록 한 곳에서 그립니다.
+    """
+    css_class, color, icon = (
+        ("pros-item", "#28a745", "fa-check") if kind == "pros" else ("cons-item", "#dc3545", "fa-times")
+    )
+    supports = supports or []
+    for idx, point in enumerate(points, 1):
+        st.markdown(f"""
+        <div class="{css_class}">
+            <span style="color: {color}; font-weight: bold;">
+                <i class="fas {icon}"></i> {idx}.
+            </span> {point}{support_badge(supports, idx - 1, color)}
+        </div>
+        """, unsafe_allow_html=True)
+
+def display_partial_results(placeholder, partial):
+    """스트리밍 중간 결과 표시 (최종 결과가 나오면 교체됨)"""
+    pros = partial["pros"]
+    cons = partial["cons"]
+    
+    with placeholder.container():
+        st.markdown(f"""
+        <div class="process-info fade-in">
+            <strong><i class="fas fa-spinner fa-spin"></i> 분석 중...</strong> 
+            <strong><i class="fas fa-thumbs-up"></i> 장점:</strong> {len(pros)}개 | 
+            <strong><i class="fas fa-thumbs-down"></i> 단점:</strong> {len(cons)}개 | 
+            <strong><i class="fas fa-link"></i> 출처:</strong> {len(partial["sources"])}개
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            display_point_items(pros, "pros")
+        
+        with col2:
+            display_point_items(cons, "cons")
+
 def display_results(final_state, show_process):
     """검색 결과 표시"""
     from components.ui import get_theme_colors
@@ -362,14 +508,7 @@ def display_results(final_state, show_process):
             """, unsafe_allow_html=True)
             
             if final_state["pros"]:
-                for idx, pro in enumerate(final_state["pros"], 1):
-                    st.markdown(f"""
-                    <div class="pros-item">
-                        <span style="color: #28a745; font-weight: bold;">
-                            <i class="fas fa-check"></i> {idx}.
-                        </span> {pro}
-                    </div>
-                    """, unsafe_allow_html=True)
+                display_point_items(final_state["pros"], "pros", final_state.get("pros_support"))
             else:
                 st.write("장점 정보가 없습니다.")
         
@@ -383,21 +522,16 @@ def display_results(final_state, show_process):
             """, unsafe_allow_html=True)
             
             if final_state["cons"]:
-                for idx, con in enumerate(final_state["cons"], 1):
-                    st.markdown(f"""
-                    <div class="cons-item">
-                        <span style="color: #dc3545; font-weight: bold;">
-                            <i class="fas fa-times"></i> {idx}.
-                        </span> {con}
-                    </div>
-                    """, unsafe_allow_html=True)
+                display_point_items(final_state["cons"], "cons", final_state.get("cons_support"))
             else:
                 st.write("단점 정보가 없습니다.")
         
         # 워드클라우드 표시
         st.markdown("---")
         st.markdown("### 🔤 키워드 분석")
-        display_wordclouds(final_state["pros"], final_state["cons"])
+        # 워드클라우드 두 개와 비교 차트를 한 번에 병렬로 계산
+        visuals = compute_visuals(final_state["pros"], final_state["cons"])
+        display_wordclouds(final_state["pros"], final_state["cons"], visuals)
         
         # 심층 분석 섹션
         st.markdown("---")
@@ -407,7 +541,7 @@ def display_results(final_state, show_process):
         col1, col2 = st.columns([1, 1])
         
         with col1:
-            chart_result = create_comparison_chart(final_state["pros"], final_state["cons"])
+            chart_result = visuals["comparison_chart"]
             if chart_result:
                 comparison_chart, category_pros, category_cons, categories = chart_result
                 st.plotly_chart(comparison_chart, use_container_width=True)
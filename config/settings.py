@@ -21,6 +21,172 @@ def get_api_keys():
         "LANGSMITH_API_KEY": os.getenv("LANGSMITH_API_KEY") or st.secrets.get("LANGSMITH_API_KEY", "")
     }
 
+# 크롤링 동시성 설정
+CRAWLER_SETTINGS = {
+    "max_workers": 8,            # 파이프라인 전체 동시 작업 수
+    "posts_per_query": 5,        # 검색어당 분석할 포스트 수
+    "max_posts": 15,             # 검색어 전체에서 분석할 최대 포스트 수
+    "wave_size": 5,              # 한 번에 처리할 포스트 수 (묶음마다 목표 달성 여부 확인)
+    "target_pros": 15,           # 이만큼 모이면 남은 후보는 건너뜀 (중복 제거 전 기준)
+    "target_cons": 15,
+    "default_host_limit": 2,     # 별도 설정이 없는 호스트의 동시 요청 수
+    "host_limits": {             # 호스트별 동시 요청 수 (고정 sleep 대체)
+        "openapi.naver.com": 3,
+        "m.blog.naver.com": 4,
+        "api.openai.com": 4
+    }
+}
+
+# 호스트별 요청 속도 제한 (토큰 버킷, 프로세스 전체 공유)
+# rate: 초당 요청 수, burst: 한 번에 보낼 수 있는 최대 요청 수
+RATE_LIMIT_SETTINGS = {
+    "default": {"rate": 5, "burst": 5},
+    "hosts": {
+        "openapi.naver.com": {"rate": 10, "burst": 10},    # 검색 API 초당 호출 한도
+        "m.blog.naver.com": {"rate": 8, "burst": 8},
+        "api.openai.com": {"rate": 3, "burst": 5}          # 분당 요청 한도(RPM) / 60 이하로
+    }
+}
+
+# HTTP 세션 설정
+HTTP_SETTINGS = {
+    "pool_size": 10,             # 호스트별 keep-alive 커넥션 수
+    "connect_timeout": 3.05,     # 연결 타임아웃 (초)
+    "read_timeout": 10,          # 응답 대기 타임아웃 (초)
+    "max_retries": 3,            # 429/5xx 재시도 횟수
+    "backoff_base": 0.5,         # 지수 백오프 기본 대기 (초)
+    "backoff_max": 8,            # 최대 대기 (초)
+    "retry_statuses": [429, 500, 502, 503, 504]
+}
+
+# 장단점 중복 제거 설정 (문자 n-gram MinHash + LSH)
+DEDUP_SETTINGS = {
+    "threshold": 0.5,                # 추정 자카드 유사도 기준
+    "ngram": 2,                      # 한글은 음절 2-gram 이 적당
+    "num_perm": 64,                  # MinHash 서명 길이
+    "bands": 16                      # LSH 밴드 수 (밴드당 num_perm / bands 행)
+}
+
+# 블로그 본문 수집 설정
+FETCH_SETTINGS = {
+    "stream": True,                  # 본문을 조금씩 읽다가 필요한 만큼 모이면 중단
+    "text_budget": 6000,             # 본문 컨테이너에서 모을 최대 글자 수
+    "max_bytes": 2 * 1024 * 1024,    # 페이지당 최대 수신 바이트
+    "chunk_size": 16 * 1024
+}
+
+# 블로그 본문 디스크 캐시 설정
+PAGE_CACHE_SETTINGS = {
+    "directory": os.getenv("PAGE_CACHE_DIR", ".cache/pages"),
+    "ttl": 60 * 60 * 24 * 7,         # 7일
+    "max_bytes": 200 * 1024 * 1024   # 200MB
+}
+
+# GPT 장단점 추출 설정
+LLM_SETTINGS = {
+    "model": "gpt-3.5-turbo",
+    "temperature": 0.3,
+    "max_tokens": 350,
+    "input_token_budget": 1000,      # 포스트당 입력 토큰 예산 (장단점 단서가 많은 문장 우선)
+    "batch_size": 5,                 # 한 번의 요청에 묶을 포스트 수 (1이면 개별 요청)
+    "batch_token_budget": 6000,      # 배치 요청의 입력 토큰 예산
+    "batch_max_tokens_per_post": 300,
+    "chars_per_token": 1.0           # 한글 기준 보수적인 글자/토큰 비율
+}
+
+# 규칙 기반 장단점 추출 설정 (신뢰도가 낮을 때만 GPT 호출)
+LOCAL_EXTRACT_SETTINGS = {
+    "enabled": True,
+    "min_confidence": 0.7,           # 이 이상이면 GPT 없이 규칙 기반 결과 사용
+    "max_points": 5
+}
+
+# GPT 추출 결과 캐시 설정
+LLM_CACHE_SETTINGS = {
+    "directory": os.getenv("LLM_CACHE_DIR", ".cache/llm"),
+    "ttl": 60 * 60 * 24 * 30,        # 30일
+    "max_bytes": 50 * 1024 * 1024,   # 50MB
+    "memory_items": 2048             # 프로세스 내 LRU 항목 수
+}
+
+# 워크플로우 실행 설정
+WORKFLOW_SETTINGS = {
+    "stream_results": True           # 포스트별 중간 결과를 화면에 바로 표시
+}
+
+# 검색 결과 캐시 설정 (프로세스 내)
+RESULT_CACHE_SETTINGS = {
+    "ttl": 60 * 10,                  # 10분
+    "max_items": 512
+}
+
+# 제품명 인덱스 설정
+PRODUCT_INDEX_SETTINGS = {
+    "ngram": 3,
+    "threshold": 0.75,               # n-gram Dice 유사도 기준
+    "refresh_interval": 60 * 10      # DB 제품명 목록 재적재 주기 (초)
+}
+
+# 동일 제품 동시 크롤링 방지 설정
+SINGLE_FLIGHT_SETTINGS = {
+    "directory": os.getenv("SINGLE_FLIGHT_DIR", ".cache/flights"),
+    "lease_ttl": 180,                # 잠금 파일 유효 시간 (초, 초과 시 회수)
+    "wait_timeout": 120,             # 다른 크롤링 결과를 기다리는 최대 시간 (초)
+    "poll_interval": 0.5,
+    "result_ttl": 60                 # 공유 결과 보관 시간 (초)
+}
+
+# DB 저장 (write-behind) 설정
+WRITER_SETTINGS = {
+    "batch_size": 200,               # 한 번에 업서트할 최대 행 수
+    "flush_interval": 2.0,           # 백그라운드 저장 주기 (초)
+    "max_attempts": 3                # 저장 실패 시 재시도 횟수
+}
+
+# 키워드 통계 설정
+KEYWORD_SETTINGS = {
+    # "auto": kiwipiepy 가 설치되어 있으면 형태소 분석, 없으면 조사 제거
+    # "josa": 조사/하다 어미 제거, "regex": 어절 그대로, "kiwi": 형태소 분석
+    "tokenizer": os.getenv("KEYWORD_TOKENIZER", "auto")
+}
+
+# 워드클라우드 렌더링 설정
+WORDCLOUD_SETTINGS = {
+    "width": 800,                    # 레이아웃 크기
+    "height": 400,
+    "scale": 2,                      # 출력 해상도 배율 (800x400 → 1600x800)
+    "format": "PNG",                 # "PNG" 또는 "WEBP"
+    "quality": 90                    # WEBP 품질
+}
+
+# 시각화 병렬 렌더링 설정
+RENDER_SETTINGS = {
+    "max_workers": 2,                # 장점/단점 워드클라우드 동시 렌더링 수 (스레드 풀)
+    "timeout": 20                    # 풀 렌더링 대기 한도 (초과 시 직접 렌더링)
+}
+
+# 워드클라우드 이미지 캐시 설정 (같은 키워드 빈도/색상/크기/폰트면 다시 그리지 않음)
+WORDCLOUD_CACHE_SETTINGS = {
+    "memory_items": 64,              # 프로세스 내 LRU 항목 수
+    "disk": True,                    # 디스크 캐시 사용 여부 (프로세스 재시작 후에도 재사용)
+    "directory": os.getenv("WORDCLOUD_CACHE_DIR", ".cache/wordcloud"),
+    "ttl": 60 * 60 * 24 * 7,         # 7일
+    "max_bytes": 50 * 1024 * 1024    # 50MB
+}
+
+# 저장소 설정 ("auto": Supabase 설정이 있으면 Supabase, 없으면 SQLite)
+STORAGE_SETTINGS = {
+    "backend": os.getenv("STORAGE_BACKEND", "auto"),   # auto | supabase | sqlite
+    "sqlite_path": os.getenv("SQLITE_PATH", "data/pros_cons.db")
+}
+
+# DB 조회 설정
+DB_READ_SETTINGS = {
+    "page_size": 100,                # 한 번에 가져올 행 수
+    "max_rows": 300,                 # 제품당 최대 조회 행 수
+    "order_column": "id"             # 페이지 순서 기준 컬럼
+}
+
 def configure_page():
     """Streamlit 페이지 설정"""
     st.set_page_config(
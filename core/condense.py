@@ -0,0 +1,90 @@
+"""
+GPT 입력용 본문 압축 (장단점 단서가 많은 문장 우선)
+"""
+import re
+
+# 문장 경계: 줄바꿈, 또는 종결 부호 뒤 공백 ("1. " 같은 번호 목록은 나누지 않음)
+_SENTENCE_SPLIT = re.compile(r'\n+|(?<=[.!?。])(?<!\d\.)\s+')
+
+# 장단점 섹션 제목 ("장점", "단점 정리", "👍 좋았던 점" ...)
+_HEADER_PATTERN = re.compile(r'^\W*(장점|단점|장단점|좋은\s*점|좋았던\s*점|아쉬운\s*점|아쉬웠던\s*점|불편한\s*점)')
+
+PRO_CUES = (
+    '장점', '좋', '만족', '훌륭', '추천', '편하', '편리', '빠르', '빠릿', '가볍', '가벼', '선명',
+    '조용', '깔끔', '넉넉', '오래가', '괜찮'
+)
+CON_CUES = (
+    '단점', '아쉽', '아쉬', '불편', '무겁', '느리', '비싸', '비싼', '발열', '소음', '부족', '별로',
+    '실망', '떨어지', '흠', '문제'
+)
+# 광고/잡담성 문장 (점수 감점)
+NOISE_CUES = ('협찬', '제공받', '이웃추가', '댓글', '구독', '공감', 'http', '#')
+
+# 섹션 제목 뒤로 가점을 받는 문장 수
+SECTION_CARRY = 5
+
+# 예산보다 긴 문장을 잘라 넣을 때 최소 글자 수
+MIN_TRUNCATED_CHARS = 40
+
+def split_sentences(content):
+    return [sentence.strip() for sentence in _SENTENCE_SPLIT.split(content) if sentence.strip()]
+
+def score_sentence(sentence, product_tokens=()):
+    """문장의 장단점 단서 점수"""
+    if _HEADER_PATTERN.match(sentence):
+        return 3.0
+    score = sum(1.0 for cue in PRO_CUES if cue in sentence)
+    score += sum(1.2 for cue in CON_CUES if cue in sentence)
+    if score and any(token in sentence.lower() for token in product_tokens):
+        score += 0.5
+    if any(cue in sentence for cue in NOISE_CUES):
+        score -= 1.5
+    if len(sentence) < 8:
+        score -= 0.5
+    return score
+
+def condense_content(content, token_budget, chars_per_token=1.0, product_name=""):
+    """token_budget 안에 장단점 단서가 많은 문장을 골라 원래 순서대로 이어붙임
+
+    본문이 예산 안에 들어가면 그대로, 단서가 없으면 앞부분을 반환합니다.
+    섹션 제목 바로 뒤 문장(목록 항목)은 제목 점수를 일부 이어받습니다.
+    """
+    char_budget = int(token_budget * chars_per_token)
+    if len(content) <= char_budget:
+        return content
+
+    sentences = split_sentences(content)
+    product_tokens = [token.lower() for token in product_name.split() if len(token) > 1]
+    scores = [score_sentence(sentence, product_tokens) for sentence in sentences]
+    if max(scores, default=0) <= 0:
+        return content[:char_budget]
+
+    # 섹션 제목 뒤 몇 문장(목록 항목)은 단서 단어가 없어도 포함되도록 가점
+    weights = list(scores)
+    carry = 0
+    for idx, sentence in enumerate(sentences):
+        if _HEADER_PATTERN.match(sentence):
+            carry = SECTION_CARRY
+        elif carry:
+            weights[idx] += 1.0
+            carry -= 1
+
+    # 글자당 점수(밀도)가 높은 문장부터 예산을 채움
+    order = sorted(
+        (idx for idx in range(len(sentences)) if weights[idx] > 0),
+        key=lambda idx: (-weights[idx] / (len(sentences[idx]) + 20), idx)
+    )
+    selected = {}
+    used = 0
+    for idx in order:
+        remaining = char_budget - used
+        sentence = sentences[idx]
+        if len(sentence) + 1 > remaining:
+            # 긴 문장은 버리지 않고 남은 예산만큼 잘라서 사용
+            if remaining < MIN_TRUNCATED_CHARS:
+                continue
+            sentence = sentence[:remaining - 1]
+        selected[idx] = sentence
+        used += len(sentence) + 1
+
+    return '\n'.join(selected[idx] for idx in sorted(selected)) or content[:char_budget]
@@ -2,11 +2,34 @@
 웹 크롤링 모듈
 """
 import requests
+import hashlib
+import json
+import random
 import re
+import threading
 import time
-from bs4 import BeautifulSoup
-from openai import OpenAI
-from config.settings import get_api_keys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from openai import APIConnectionError, InternalServerError, OpenAI, RateLimitError
+from requests.adapters import HTTPAdapter
+from config.settings import (
+    get_api_keys, CRAWLER_SETTINGS, HTTP_SETTINGS, PAGE_CACHE_SETTINGS,
+    LLM_SETTINGS, LLM_CACHE_SETTINGS, DEDUP_SETTINGS, FETCH_SETTINGS,
+    LOCAL_EXTRACT_SETTINGS, RATE_LIMIT_SETTINGS
+)
+from core.condense import condense_content
+from core.dedup import MinHashDeduplicator
+from core.local_extract import extract_pros_cons_locally
+from core.scheduler import rank_candidates
+from core.html_extract import clean_snippet, extract_main_text, read_main_text
+from utils.cache import DiskCache
+from utils.ratelimit import RateLimiters
+
+# 본문 캐시 형식 (줄바꿈을 보존하도록 바뀐 뒤의 항목만 사용)
+PAGE_CACHE_FORMAT = "lines"
+
+# 크롤러 인스턴스(세션)가 여러 개여도 호스트별 호출 속도는 프로세스 전체에서 제한
+RATE_LIMITERS = RateLimiters(RATE_LIMIT_SETTINGS["hosts"], RATE_LIMIT_SETTINGS["default"])
 
 class ProConsLaptopCrawler:
     def __init__(self, naver_client_id=None, naver_client_secret=None):
@@ -15,19 +38,165 @@ class ProConsLaptopCrawler:
             "X-Naver-Client-Id": naver_client_id or keys["NAVER_CLIENT_ID"],
             "X-Naver-Client-Secret": naver_client_secret or keys["NAVER_CLIENT_SECRET"]
         }
-        self.openai_client = OpenAI(api_key=keys["OPENAI_API_KEY"]) if keys["OPENAI_API_KEY"] else None
+        self.openai_client = OpenAI(
+            api_key=keys["OPENAI_API_KEY"],
+            timeout=HTTP_SETTINGS["read_timeout"] * 3,
+            max_retries=0                  # 재시도는 chat_completion 에서 (속도 제한 버킷과 연동)
+        ) if keys["OPENAI_API_KEY"] else None
         
         self.stats = {
             'total_crawled': 0,
             'valid_pros_cons': 0,
-            'api_errors': 0
+            'api_errors': 0,
+            'http_retries': 0,
+            'page_cache_hits': 0,
+            'page_cache_misses': 0,
+            'llm_cache_hits': 0,
+            'llm_cache_misses': 0,
+            'local_extractions': 0,
+            'rate_limit_waits': 0,
+            'rate_limit_wait_seconds': 0.0
+        }
+        self._stats_lock = threading.Lock()
+        
+        # 호스트별 동시 요청 제한 (고정 sleep 대신 사용)
+        self._host_semaphores = {
+            host: threading.BoundedSemaphore(limit)
+            for host, limit in CRAWLER_SETTINGS["host_limits"].items()
         }
+        self._host_semaphores_lock = threading.Lock()
+        
+        # 호스트별 keep-alive 세션 (핸드셰이크는 프로세스당 한 번)
+        self._sessions = {}
+        self._sessions_lock = threading.Lock()
+        
+        # 블로그 본문 캐시 (blog_id, post_no) → 정제된 본문
+        self.page_cache = DiskCache(
+            PAGE_CACHE_SETTINGS["directory"],
+            ttl=PAGE_CACHE_SETTINGS["ttl"],
+            max_bytes=PAGE_CACHE_SETTINGS["max_bytes"]
+        )
+        
+        # GPT 추출 결과 캐시 (model, product_name, preview 해시, temperature) → {'pros', 'cons'}
+        self.llm_cache = DiskCache(
+            LLM_CACHE_SETTINGS["directory"],
+            ttl=LLM_CACHE_SETTINGS["ttl"],
+            max_bytes=LLM_CACHE_SETTINGS["max_bytes"],
+            memory_items=LLM_CACHE_SETTINGS["memory_items"]
+        )
+        
+        self.deduplicator = MinHashDeduplicator(
+            threshold=DEDUP_SETTINGS["threshold"],
+            ngram=DEDUP_SETTINGS["ngram"],
+            num_perm=DEDUP_SETTINGS["num_perm"],
+            bands=DEDUP_SETTINGS["bands"]
+        )
+    
+    def get_session(self, host):
+        """호스트별 커넥션 풀 세션 반환"""
+        with self._sessions_lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=HTTP_SETTINGS["pool_size"]
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[host] = session
+            return session
+    
+    def _backoff_delay(self, attempt, response=None):
+        """지터가 적용된 지수 백오프 대기 시간 계산"""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return min(float(retry_after), HTTP_SETTINGS["backoff_max"])
+        
+        delay = min(HTTP_SETTINGS["backoff_base"] * (2 ** attempt), HTTP_SETTINGS["backoff_max"])
+        return random.uniform(0, delay)
+    
+    def http_get(self, host, url, **kwargs):
+        """호스트별 세션으로 GET 요청 (타임아웃, 429/5xx 재시도 포함)"""
+        session = self.get_session(host)
+        kwargs.setdefault("timeout", (HTTP_SETTINGS["connect_timeout"], HTTP_SETTINGS["read_timeout"]))
+        max_retries = HTTP_SETTINGS["max_retries"]
+        
+        for attempt in range(max_retries + 1):
+            try:
+                with self.host_slot(host):
+                    response = session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= max_retries:
+                    raise
+                self.increment_stat('http_retries')
+                time.sleep(self._backoff_delay(attempt))
+                continue
+            
+            if response.status_code in HTTP_SETTINGS["retry_statuses"] and attempt < max_retries:
+                self.increment_stat('http_retries')
+                delay = self._backoff_delay(attempt, response)
+                response.close()
+                if response.status_code == 429:
+                    # 버킷을 비워 다른 스레드의 요청도 함께 늦춤 (대기는 다음 host_slot 에서)
+                    RATE_LIMITERS.get(host).penalize(delay)
+                else:
+                    time.sleep(delay)
+                continue
+            
+            return response
+    
+    def chat_completion(self, **kwargs):
+        """OpenAI chat completion (호스트 속도 제한 + 429/일시 오류 재시도)
+        
+        OpenAI 클라이언트 자체 재시도는 끄고 여기서 재시도하므로, 429 가 나면
+        api.openai.com 버킷을 비워 다른 스레드의 요청도 함께 늦춥니다.
+        """
+        max_retries = HTTP_SETTINGS["max_retries"]
+        for attempt in range(max_retries + 1):
+            try:
+                with self.host_slot("api.openai.com"):
+                    return self.openai_client.chat.completions.create(**kwargs)
+            except RateLimitError as e:
+                if attempt >= max_retries:
+                    raise
+                self.increment_stat('http_retries')
+                RATE_LIMITERS.get("api.openai.com").penalize(self._backoff_delay(attempt, e.response))
+            except (APIConnectionError, InternalServerError):
+                if attempt >= max_retries:
+                    raise
+                self.increment_stat('http_retries')
+                time.sleep(self._backoff_delay(attempt))
+    
+    def rate_limit_waits(self):
+        """{호스트: (대기 횟수, 총 대기 시간)} (프로세스 전체 누적)"""
+        return RATE_LIMITERS.wait_stats()
+    
+    def increment_stat(self, name, amount=1):
+        """통계 값 증가 (스레드 안전)"""
+        with self._stats_lock:
+            self.stats[name] = self.stats.get(name, 0) + amount
+    
+    @contextmanager
+    def host_slot(self, host):
+        """호스트별 요청 속도 + 동시 요청 수 제한"""
+        wait = RATE_LIMITERS.get(host).acquire()
+        if wait:
+            self.increment_stat('rate_limit_waits')
+            self.increment_stat('rate_limit_wait_seconds', wait)
+        
+        with self._host_semaphores_lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(CRAWLER_SETTINGS["default_host_limit"])
+                self._host_semaphores[host] = semaphore
+        with semaphore:
+            yield
     
     def remove_html_tags(self, text):
         """HTML 태그 제거"""
-        text = BeautifulSoup(text, "html.parser").get_text()
-        text = re.sub(r'<[^>]+>', '', text)
-        return text.strip()
+        return clean_snippet(text)
     
     def search_blog(self, query, display=20):
         """네이버 블로그 검색"""
@@ -39,7 +208,7 @@ class ProConsLaptopCrawler:
         }
         
         try:
-            response = requests.get(url, headers=self.naver_headers, params=params)
+            response = self.http_get("openapi.naver.com", url, headers=self.naver_headers, params=params)
             if response.status_code == 200:
                 result = response.json()
                 for item in result.get('items', []):
@@ -58,40 +227,139 @@ class ProConsLaptopCrawler:
                 if len(parts) >= 5:
                     blog_id = parts[3]
                     post_no = parts[4].split('?')[0]
+                    
+                    cache_key = (PAGE_CACHE_FORMAT, blog_id, post_no)
+                    cached = self.page_cache.get(cache_key)
+                    if cached is not None:
+                        self.increment_stat('page_cache_hits')
+                        return cached
+                    self.increment_stat('page_cache_misses')
+                    
                     mobile_url = f"https://m.blog.naver.com/{blog_id}/{post_no}"
                     
-                    response = requests.get(mobile_url, headers={
+                    response = self.http_get("m.blog.naver.com", mobile_url, headers={
                         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                    })
+                    }, stream=FETCH_SETTINGS["stream"])
                     
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        
-                        content = ""
-                        for selector in ['div.se-main-container', 'div#postViewArea', 'div.post_ct']:
-                            elem = soup.select_one(selector)
-                            if elem:
-                                content = elem.get_text(separator='\n', strip=True)
-                                break
-                        
-                        if not content:
-                            content = soup.get_text(separator='\n', strip=True)
-                        
-                        content = re.sub(r'\s+', ' ', content)
-                        content = content.replace('\u200b', '')
-                        
-                        return content if len(content) > 300 else None
+                    # stream=True 응답은 끝까지 읽지 않으면 커넥션이 풀로 돌아가지 않으므로 항상 닫음
+                    with response:
+                        if response.status_code == 200:
+                            if FETCH_SETTINGS["stream"]:
+                                # 추출에 필요한 만큼만 받고 중단
+                                content = read_main_text(
+                                    response,
+                                    text_budget=FETCH_SETTINGS["text_budget"],
+                                    max_bytes=FETCH_SETTINGS["max_bytes"],
+                                    chunk_size=FETCH_SETTINGS["chunk_size"]
+                                )
+                            else:
+                                content = extract_main_text(response.content)
+                            
+                            # 줄바꿈은 문장/목록 경계이므로 남기고 가로 공백과 빈 줄만 정리
+                            content = content.replace('\u200b', '')
+                            content = re.sub(r'[^\S\n]+', ' ', content)
+                            content = re.sub(r' ?\n[\s]*', '\n', content).strip()
+                            
+                            if len(content) > 300:
+                                self.page_cache.set(cache_key, content)
+                                return content
+                            return None
         except Exception as e:
             print(f"크롤링 오류: {e}")
         return None
     
+    def llm_cache_key(self, product_name, content_preview):
+        """GPT 추출 결과 캐시 키"""
+        preview_hash = hashlib.sha256(content_preview.encode('utf-8')).hexdigest()
+        return (LLM_SETTINGS["model"], product_name, preview_hash, LLM_SETTINGS["temperature"])
+    
+    def parse_pros_cons(self, result):
+        """GPT 응답 텍스트에서 장단점 목록 파싱"""
+        pros = []
+        cons = []
+        
+        if not result or "정보 부족" in result:
+            return {'pros': pros, 'cons': cons}
+        
+        lines = result.split('\n')
+        current_section = None
+        
+        for line in lines:
+            line = line.strip()
+            if '장점:' in line or '장점 :' in line:
+                current_section = 'pros'
+            elif '단점:' in line or '단점 :' in line:
+                current_section = 'cons'
+            elif line.startswith('-') and current_section:
+                point = line[1:].strip()
+                if point and len(point) > 5:
+                    if current_section == 'pros':
+                        pros.append(point)
+                    else:
+                        cons.append(point)
+        
+        return {'pros': pros[:5], 'cons': cons[:5]}
+    
+    def extract_locally(self, content):
+        """규칙 기반 추출. (장단점 또는 None, GPT 없이 써도 될 만큼 확실한지) 반환"""
+        if not LOCAL_EXTRACT_SETTINGS["enabled"]:
+            return None, False
+        pros_cons, confidence = extract_pros_cons_locally(content, LOCAL_EXTRACT_SETTINGS["max_points"])
+        if not (pros_cons['pros'] or pros_cons['cons']):
+            return None, False
+        return pros_cons, confidence >= LOCAL_EXTRACT_SETTINGS["min_confidence"]
+    
+    def _use_local(self, pros_cons, confident):
+        """규칙 기반 결과 사용. 신뢰도가 낮으면 tentative 로 표시 (화면에만 쓰고 DB에는 저장하지 않음)"""
+        self.increment_stat('local_extractions')
+        self.increment_stat('valid_pros_cons')
+        return pros_cons if confident else dict(pros_cons, tentative=True)
+    
+    def extract_pros_cons(self, product_name, content):
+        """규칙 기반 추출을 먼저 시도하고, 신뢰도가 낮을 때만 GPT로 추출
+        
+        OpenAI 키가 없으면 신뢰도가 낮아도 규칙 기반 결과를 사용합니다.
+        """
+        if not content or len(content) < 200:
+            return None
+        
+        local, confident = self.extract_locally(content)
+        if local and (confident or not self.openai_client):
+            return self._use_local(local, confident)
+        
+        return self.extract_pros_cons_with_gpt(product_name, content)
+    
+    def condense(self, product_name, content):
+        """입력 토큰 예산에 맞춰 장단점 단서가 많은 문장만 남김"""
+        return condense_content(
+            content,
+            LLM_SETTINGS["input_token_budget"],
+            LLM_SETTINGS["chars_per_token"],
+            product_name
+        )
+    
     def extract_pros_cons_with_gpt(self, product_name, content):
         """ChatGPT로 장단점 추출"""
         if not content or len(content) < 200 or not self.openai_client:
             return None
         
-        content_preview = content[:1500]
+        content_preview = self.condense(product_name, content)
+        
+        # 같은 미리보기에 대한 이전 추출 결과 재사용 ("정보 부족"도 빈 결과로 캐시됨)
+        cache_key = self.llm_cache_key(product_name, content_preview)
+        cached = self.llm_cache.get(cache_key)
+        if cached is not None:
+            self.increment_stat('llm_cache_hits')
+            if cached['pros'] or cached['cons']:
+                self.increment_stat('valid_pros_cons')
+                return cached
+            return None
+        self.increment_stat('llm_cache_misses')
         
+        return self._request_pros_cons(product_name, content_preview, cache_key)
+    
+    def _request_pros_cons(self, product_name, content_preview, cache_key):
+        """미리보기 하나를 개별 요청으로 추출하고 캐시에 저장 (길이/캐시 확인은 호출한 쪽에서)"""
         prompt = f"""다음은 "{product_name}"에 대한 블로그 리뷰입니다.
 
 [블로그 내용]
@@ -115,8 +383,8 @@ class ProConsLaptopCrawler:
 만약 장단점 정보가 충분하지 않으면 "정보 부족"이라고 답해주세요."""
         
         try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
+            response = self.chat_completion(
+                model=LLM_SETTINGS["model"],
                 messages=[
                     {
                         "role": "system", 
@@ -127,63 +395,287 @@ class ProConsLaptopCrawler:
                         "content": prompt
                     }
                 ],
-                temperature=0.3,
-                max_tokens=500
+                temperature=LLM_SETTINGS["temperature"],
+                max_tokens=LLM_SETTINGS["max_tokens"]
             )
             
             result = response.choices[0].message.content.strip()
+            pros_cons = self.parse_pros_cons(result)
+            self.llm_cache.set(cache_key, pros_cons)
             
-            if result and "정보 부족" not in result:
-                pros = []
-                cons = []
-                
-                lines = result.split('\n')
-                current_section = None
-                
-                for line in lines:
-                    line = line.strip()
-                    if '장점:' in line or '장점 :' in line:
-                        current_section = 'pros'
-                    elif '단점:' in line or '단점 :' in line:
-                        current_section = 'cons'
-                    elif line.startswith('-') and current_section:
-                        point = line[1:].strip()
-                        if point and len(point) > 5:
-                            if current_section == 'pros':
-                                pros.append(point)
-                            else:
-                                cons.append(point)
-                
-                if pros or cons:
-                    self.stats['valid_pros_cons'] += 1
-                    return {
-                        'pros': pros[:5],
-                        'cons': cons[:5]
-                    }
+            if pros_cons['pros'] or pros_cons['cons']:
+                self.increment_stat('valid_pros_cons')
+                return pros_cons
             
             return None
                 
         except Exception as e:
-            self.stats['api_errors'] += 1
+            self.increment_stat('api_errors')
             print(f"GPT API 오류: {str(e)[:100]}")
             return None
     
-    def deduplicate_points(self, points):
-        """유사한 장단점 중복 제거"""
-        if not points:
-            return []
+    def _build_batch_prompt(self, product_name, previews):
+        """여러 포스트를 구분자로 묶은 배치 프롬프트 생성"""
+        blocks = "\n\n".join(
+            f"=== POST {post_id} ===\n{preview}" for post_id, preview in previews
+        )
         
-        unique_points = []
-        seen_keywords = set()
+        return f"""다음은 "{product_name}"에 대한 블로그 리뷰 {len(previews)}개입니다.
+각 리뷰는 "=== POST 번호 ===" 로 구분됩니다.
+
+{blocks}
+
+각 리뷰에서 {product_name}의 장점과 단점을 리뷰별로 따로 추출해주세요.
+실제 사용 경험에 기반한 구체적인 내용만 포함하고, 리뷰당 장점/단점은 각각 최대 3개입니다.
+장단점 정보가 충분하지 않은 리뷰는 빈 배열로 두세요.
+
+다음 JSON 형식으로만 응답해주세요:
+{{"results": [{{"id": 번호, "pros": ["장점", ...], "cons": ["단점", ...]}}]}}"""
+    
+    def _parse_batch_response(self, result, post_ids):
+        """배치 JSON 응답을 포스트별 장단점으로 분리"""
+        data = json.loads(result)
+        parsed = {}
         
-        for point in points:
-            keywords = set(word for word in point.split() if len(word) > 2)
+        for item in data.get('results', []):
+            try:
+                post_id = int(item.get('id'))
+            except (TypeError, ValueError):
+                continue
+            if post_id not in post_ids:
+                continue
             
-            if len(keywords & seen_keywords) < len(keywords) * 0.5:
-                unique_points.append(point)
-                seen_keywords.update(keywords)
+            pros_cons = {}
+            for key in ('pros', 'cons'):
+                points = [str(point).strip() for point in item.get(key) or []]
+                pros_cons[key] = [point for point in points if len(point) > 5][:5]
+            parsed[post_id] = pros_cons
+        
+        return parsed
+    
+    def _extract_batch(self, product_name, batch):
+        """배치 하나를 한 번의 요청으로 추출
+        
+        요청이나 응답 파싱이 실패하면 배치 전체를 None 으로, 응답에서 빠진 포스트만 개별 요청으로 처리합니다.
+        batch: [(post_id, content_preview, cache_key), ...]
+        """
+        post_ids = {post_id for post_id, _, _ in batch}
+        prompt = self._build_batch_prompt(product_name, [(post_id, preview) for post_id, preview, _ in batch])
+        
+        try:
+            response = self.chat_completion(
+                model=LLM_SETTINGS["model"],
+                messages=[
+                    {
+                        "role": "system", 
+                        "content": "당신은 제품 리뷰 분석 전문가입니다. 실제 사용 경험에 기반한 장단점만 추출하고 JSON으로만 응답합니다."
+                    },
+                    {
+                        "role": "user", 
+                        "content": prompt
+                    }
+                ],
+                temperature=LLM_SETTINGS["temperature"],
+                max_tokens=LLM_SETTINGS["batch_max_tokens_per_post"] * len(batch),
+                response_format={"type": "json_object"}
+            )
+        except Exception as e:
+            # 요청 자체가 실패하면 같은 오류를 포스트 수만큼 반복하지 않도록 배치 전체를 실패 처리
+            self.increment_stat('api_errors')
+            print(f"GPT 배치 API 오류: {str(e)[:100]}")
+            return {post_id: None for post_id in post_ids}
+        
+        try:
+            parsed = self._parse_batch_response(response.choices[0].message.content, post_ids)
+        except (ValueError, AttributeError, TypeError) as e:
+            self.increment_stat('api_errors')
+            print(f"GPT 배치 응답 파싱 오류: {str(e)[:100]}")
+            return {post_id: None for post_id in post_ids}
+        
+        results = {}
+        for post_id, preview, cache_key in batch:
+            pros_cons = parsed.get(post_id)
+            if pros_cons is None:
+                # 응답에서 빠진 포스트는 개별 요청으로 처리 (이미 압축/캐시 확인된 미리보기 그대로)
+                results[post_id] = self._request_pros_cons(product_name, preview, cache_key)
+                continue
+            
+            self.llm_cache.set(cache_key, pros_cons)
+            if pros_cons['pros'] or pros_cons['cons']:
+                self.increment_stat('valid_pros_cons')
+                results[post_id] = pros_cons
+            else:
+                results[post_id] = None
+        
+        return results
+    
+    def extract_pros_cons_batch(self, product_name, contents, executor=None, on_extracted=None):
+        """여러 포스트의 장단점을 배치 요청으로 추출
+        
+        규칙 기반 추출로 충분한 포스트는 제외하고, 나머지 미리보기를
+        토큰 예산 안에서 묶어 요청 수를 줄입니다. 결과는 contents 순서대로 (포스트별 출처 유지) 반환합니다.
+        on_extracted(index, pros_cons) 는 결과가 나오는 즉시 호출됩니다.
+        """
+        results = [None] * len(contents)
+        
+        pending = []
+        for idx, content in enumerate(contents):
+            if not content or len(content) < 200:
+                continue
+            
+            # 구조가 뚜렷한 포스트는 규칙 기반 결과로 처리 (키가 없으면 항상)
+            local, confident = self.extract_locally(content)
+            if local and (confident or not self.openai_client):
+                results[idx] = self._use_local(local, confident)
+                if on_extracted:
+                    on_extracted(idx, results[idx])
+                continue
+            if not self.openai_client:
+                continue
+            
+            content_preview = self.condense(product_name, content)
+            cache_key = self.llm_cache_key(product_name, content_preview)
+            cached = self.llm_cache.get(cache_key)
+            if cached is not None:
+                self.increment_stat('llm_cache_hits')
+                if cached['pros'] or cached['cons']:
+                    self.increment_stat('valid_pros_cons')
+                    results[idx] = cached
+                    if on_extracted:
+                        on_extracted(idx, cached)
+                continue
+            
+            self.increment_stat('llm_cache_misses')
+            pending.append((idx + 1, content_preview, cache_key))
+        
+        # 토큰 예산과 배치 크기에 맞춰 묶기
+        batches = []
+        current = []
+        current_tokens = 0
+        for item in pending:
+            tokens = len(item[1]) / LLM_SETTINGS["chars_per_token"]
+            if current and (
+                len(current) >= LLM_SETTINGS["batch_size"]
+                or current_tokens + tokens > LLM_SETTINGS["batch_token_budget"]
+            ):
+                batches.append(current)
+                current = []
+                current_tokens = 0
+            current.append(item)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        
+        def run_batch(batch):
+            batch_result = self._extract_batch(product_name, batch)
+            if on_extracted:
+                for post_id, pros_cons in batch_result.items():
+                    if pros_cons:
+                        on_extracted(post_id - 1, pros_cons)
+            return batch_result
+        
+        if executor:
+            batch_results = executor.map(run_batch, batches)
+        else:
+            batch_results = [run_batch(batch) for batch in batches]
+        
+        for batch_result in batch_results:
+            for post_id, pros_cons in batch_result.items():
+                results[post_id - 1] = pros_cons
+        
+        return results
+    
+    def fetch_post_content(self, post):
+        """포스트 하나의 본문 수집"""
+        content = self.crawl_content(post['link'])
+        if content:
+            self.increment_stat('total_crawled')
+        return content
+    
+    def process_post(self, product_name, post):
+        """포스트 하나의 본문 수집 + 장단점 추출"""
+        content = self.fetch_post_content(post)
+        if not content:
+            return None
+        
+        return self.extract_pros_cons(product_name, content)
+    
+    def _process_and_report(self, product_name, post, on_result):
+        pros_cons = self.process_post(product_name, post)
+        if pros_cons and on_result:
+            on_result(post, pros_cons)
+        return pros_cons
+    
+    def collect_pros_cons(self, product_name, queries, posts_per_query=None, on_result=None):
+        """검색 → 후보 우선순위 정렬 → 본문 수집/장단점 추출을 병렬로 실행
+        
+        모든 검색어의 결과를 링크 기준으로 합친 뒤 장단점 정보가 많아 보이는 포스트부터
+        wave_size 개씩 처리하고, 목표 장단점 수를 채우면 나머지 후보는 건너뜁니다.
+        LLM_SETTINGS["batch_size"] 가 1보다 크면 묶음마다 본문을 모은 뒤 배치로 추출합니다.
+        on_result(post, pros_cons) 는 포스트별 추출이 끝나는 즉시 (작업 스레드에서) 호출됩니다.
+        
+        {"searches": [(검색어, 발견 수 또는 None)], "candidates", "posts", "extractions", "skipped"}
+        를 반환하며 posts/extractions 는 처리한 순서 (우선순위 순) 입니다.
+        """
+        posts_per_query = posts_per_query or CRAWLER_SETTINGS["posts_per_query"]
+        max_posts = min(CRAWLER_SETTINGS["max_posts"], posts_per_query * len(queries))
+        wave_size = CRAWLER_SETTINGS["wave_size"]
+        batch_mode = LLM_SETTINGS["batch_size"] > 1
+        
+        with ThreadPoolExecutor(max_workers=CRAWLER_SETTINGS["max_workers"]) as executor:
+            # 1단계: 검색어 병렬 검색
+            search_results = list(executor.map(lambda query: self.search_blog(query, display=10), queries))
+            items = [result['items'] if result and 'items' in result else None for result in search_results]
+            
+            # 2단계: 검색어 간 중복 제거 + 우선순위 정렬
+            candidates = rank_candidates(product_name, items)
             
-            if len(unique_points) >= 10:
-                break
+            # 3단계: 우선순위 순으로 묶음 처리, 목표 수량을 채우면 중단
+            posts = []
+            extractions = []
+            pros_count = cons_count = 0
+            while len(posts) < max_posts and len(posts) < len(candidates):
+                if pros_count >= CRAWLER_SETTINGS["target_pros"] and cons_count >= CRAWLER_SETTINGS["target_cons"]:
+                    break
+                
+                wave = candidates[len(posts):min(len(posts) + wave_size, max_posts)]
+                if batch_mode:
+                    contents = list(executor.map(self.fetch_post_content, wave))
+                    on_extracted = (lambda idx, pros_cons, wave=wave: on_result(wave[idx], pros_cons)) if on_result else None
+                    results = self.extract_pros_cons_batch(product_name, contents, executor, on_extracted)
+                else:
+                    futures = [executor.submit(self._process_and_report, product_name, post, on_result) for post in wave]
+                    results = [future.result() for future in futures]
+                
+                posts.extend(wave)
+                extractions.extend(results)
+                for pros_cons in results:
+                    if pros_cons:
+                        pros_count += len(pros_cons['pros'])
+                        cons_count += len(pros_cons['cons'])
+        
+        return {
+            'searches': [(query, len(found) if found is not None else None) for query, found in zip(queries, items)],
+            'candidates': len(candidates),
+            'posts': posts,
+            'extractions': extractions,
+            'skipped': min(len(candidates), max_posts) - len(posts)
+        }
+    
+    def deduplicate_points(self, points, limit=10):
+        """유사한 장단점 중복 제거 (묶음별 대표 문장만 남김)"""
+        if not points:
+            return []
+        
+        return self.deduplicator.deduplicate(points, limit=limit)
+    
+    def aggregate_points(self, points, source_ids, limit=10):
+        """출처별 장단점을 묶어 지지 출처 수 순으로 정렬
+        
+        (대표 문장 목록, 지지 출처 수 목록) 을 반환합니다.
+        """
+        if not points:
+            return [], []
         
-        return unique_points
+        ranked = self.deduplicator.aggregate(points, source_ids, limit=limit)
+        return [point for point, _ in ranked], [support for _, support in ranked]
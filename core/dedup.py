@@ -0,0 +1,136 @@
+"""
+장단점 유사 문장 묶기 (문자 n-gram MinHash + LSH)
+"""
+import re
+import zlib
+import numpy as np
+
+_PRIME = (1 << 31) - 1
+_WORD_PATTERN = re.compile(r'[가-힣a-z0-9]+')
+_NUMBER_PATTERN = re.compile(r'\d+(?:\.\d+)?')
+
+class MinHashDeduplicator:
+    """문자 n-gram MinHash 서명과 LSH 밴딩으로 비슷한 문장을 한 번에 묶음
+
+    모든 문장의 서명을 numpy로 한 번에 계산하고, 같은 밴드 버킷에 들어간 쌍만
+    추정 자카드 유사도로 확인하므로 수천 개도 빠르게 처리합니다.
+    """
+
+    def __init__(self, threshold=0.5, ngram=2, num_perm=64, bands=16, seed=42):
+        self.threshold = threshold
+        self.ngram = ngram
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _PRIME, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, _PRIME, size=num_perm).astype(np.uint64)
+
+    def _shingles(self, text):
+        """공백/기호를 뺀 문자 n-gram 해시 집합"""
+        text = re.sub(r'[\s\W_]+', '', text.lower())
+        if len(text) <= self.ngram:
+            grams = {text}
+        else:
+            grams = {text[i:i + self.ngram] for i in range(len(text) - self.ngram + 1)}
+        return [zlib.crc32(gram.encode('utf-8')) % _PRIME for gram in grams]
+
+    def signatures(self, points):
+        """(문장 수, num_perm) MinHash 서명 행렬"""
+        shingles = [self._shingles(point) for point in points]
+        lengths = np.array([len(s) for s in shingles])
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        hashes = np.fromiter((h for s in shingles for h in s), dtype=np.uint64, count=int(lengths.sum()))
+
+        signatures = np.empty((len(points), self.num_perm), dtype=np.uint64)
+        for i in range(self.num_perm):
+            permuted = (self._a[i] * hashes + self._b[i]) % _PRIME
+            signatures[:, i] = np.minimum.reduceat(permuted, offsets)
+        return signatures
+
+    def _guard_key(self, point):
+        """서로 묶일 수 있는 문장의 조건: 첫 어절 앞 두 글자(주어)와 숫자 집합이 같음
+
+        "발열이 불편합니다" / "포트가 불편합니다" 처럼 서술부만 같거나,
+        "배터리 8시간" / "배터리 10시간" 처럼 숫자만 다른 문장은 묶지 않습니다.
+        """
+        words = _WORD_PATTERN.findall(point.lower())
+        subject = words[0][:2] if words else ''
+        return subject, tuple(sorted(set(_NUMBER_PATTERN.findall(point))))
+
+    def cluster(self, points):
+        """비슷한 문장끼리 묶은 인덱스 목록 (각 묶음의 첫 등장 순서)과 서명 행렬
+
+        앞에서부터 아직 묶이지 않은 문장을 기준(시드)으로 삼고, LSH 버킷을 공유하는 후보 중
+        시드와 추정 유사도가 threshold 이상인 문장만 넣습니다. 후보끼리 이어 붙이지 않으므로
+        A~B, B~C 라는 이유로 A 와 C 가 묶이는 일이 없습니다.
+        """
+        if not points:
+            return [], None
+        signatures = self.signatures(points)
+        count = len(points)
+        guards = [self._guard_key(point) for point in points]
+
+        # (밴드, 밴드 서명, 조건 키) → 문장 인덱스 목록
+        band_weights = np.random.RandomState(0).randint(1, _PRIME, size=self.rows).astype(np.uint64)
+        band_keys = np.stack([
+            signatures[:, band * self.rows:(band + 1) * self.rows] @ band_weights
+            for band in range(self.bands)
+        ], axis=1).tolist()
+        buckets = {}
+        for idx in range(count):
+            for band, key in enumerate(band_keys[idx]):
+                buckets.setdefault((band, key, guards[idx]), []).append(idx)
+
+        assigned = np.zeros(count, dtype=bool)
+        clusters = []
+        for seed in range(count):
+            if assigned[seed]:
+                continue
+            assigned[seed] = True
+            candidates = {
+                idx
+                for band, key in enumerate(band_keys[seed])
+                for idx in buckets[(band, key, guards[seed])]
+            }
+            candidates = np.array(sorted(idx for idx in candidates if not assigned[idx]), dtype=np.int64)
+            members = [seed]
+            if len(candidates):
+                similarity = (signatures[candidates] == signatures[seed]).mean(axis=1)
+                matched = candidates[similarity >= self.threshold]
+                assigned[matched] = True
+                members.extend(matched.tolist())
+            clusters.append(members)
+        return clusters, signatures
+
+    def representative(self, points, members, signatures, sample_size=64):
+        """묶음에서 다른 문장과 가장 비슷한 (중심) 문장, 동점이면 더 구체적인(긴) 문장
+
+        큰 묶음은 앞쪽 sample_size 개 문장과의 유사도로 근사합니다.
+        """
+        if len(members) == 1:
+            return members[0]
+        cluster_sig = signatures[members]
+        reference = cluster_sig[:sample_size]
+        similarity = (cluster_sig[:, None, :] == reference[None, :, :]).mean(axis=2).sum(axis=1)
+        return max(zip(members, similarity), key=lambda item: (item[1], len(points[item[0]])))[0]
+
+    def deduplicate(self, points, limit=None):
+        """묶음별 대표 문장만 남김"""
+        clusters, signatures = self.cluster(points)
+        unique = [points[self.representative(points, members, signatures)] for members in clusters]
+        return unique[:limit] if limit else unique
+
+    def aggregate(self, points, source_ids, limit=None):
+        """출처가 달라도 같은 의미의 문장을 묶고, 지지 출처 수로 순위 매김
+
+        [(대표 문장, 지지 출처 수), ...] 를 지지 출처 수 내림차순 (동점이면 먼저 등장한 순)으로 반환합니다.
+        """
+        clusters, signatures = self.cluster(points)
+        source_ids = np.asarray(source_ids)
+        ranked = [
+            (points[self.representative(points, members, signatures)], len(np.unique(source_ids[members])))
+            for members in clusters
+        ]
+        ranked.sort(key=lambda item: -item[1])
+        return ranked[:limit] if limit else ranked
@@ -0,0 +1,171 @@
+"""
+HTML 텍스트 추출
+"""
+import codecs
+import html
+import re
+from html.parser import HTMLParser
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml.html
+except ImportError:  # lxml 이 없으면 html.parser + SoupStrainer 로 대체
+    lxml = None
+
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# 블로그 본문 컨테이너 (우선순위 순)
+MAIN_CONTAINER_XPATHS = [
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' se-main-container ')]",
+    "//div[@id='postViewArea']",
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' post_ct ')]"
+]
+MAIN_CONTAINER_SELECTORS = ['div.se-main-container', 'div#postViewArea', 'div.post_ct']
+
+def clean_snippet(text):
+    """검색 API 제목/요약의 태그(<b> 등)와 HTML 엔티티 제거"""
+    text = html.unescape(_TAG_PATTERN.sub('', text))
+    return _TAG_PATTERN.sub('', text).strip()
+
+def _is_main_container(name, attrs):
+    """본문 컨테이너 div 인지 확인 (SoupStrainer 용)"""
+    if name != 'div':
+        return False
+    classes = attrs.get('class') or ''
+    if not isinstance(classes, str):
+        classes = ' '.join(classes)
+    classes = classes.split()
+    return 'se-main-container' in classes or 'post_ct' in classes or attrs.get('id') == 'postViewArea'
+
+def _joined_text(elem):
+    return '\n'.join(text.strip() for text in elem.itertext() if text.strip())
+
+def _extract_with_lxml(markup):
+    # 네이버 모바일 블로그는 UTF-8 (bytes 를 latin-1 로 추측하지 않도록 지정)
+    parser = lxml.html.HTMLParser(encoding='utf-8') if isinstance(markup, bytes) else None
+    tree = lxml.html.fromstring(markup, parser=parser)
+    for xpath in MAIN_CONTAINER_XPATHS:
+        elems = tree.xpath(xpath)
+        if elems:
+            return _joined_text(elems[0]) or _joined_text(tree)
+    return _joined_text(tree)
+
+def _extract_with_soup(markup):
+    # 본문 컨테이너 하위만 파싱해 트리 생성 비용을 줄임
+    soup = BeautifulSoup(markup, 'html.parser', parse_only=SoupStrainer(_is_main_container))
+    for selector in MAIN_CONTAINER_SELECTORS:
+        elem = soup.select_one(selector)
+        if elem:
+            content = elem.get_text(separator='\n', strip=True)
+            if content:
+                return content
+            break
+    return BeautifulSoup(markup, 'html.parser').get_text(separator='\n', strip=True)
+
+def extract_main_text(markup):
+    """블로그 페이지에서 본문 컨테이너 텍스트 추출 (없으면 페이지 전체 텍스트)"""
+    if lxml is not None:
+        try:
+            return _extract_with_lxml(markup)
+        except Exception:
+            pass
+    return _extract_with_soup(markup)
+
+class MainTextCollector(HTMLParser):
+    """조각 단위로 HTML 을 받아 본문 컨테이너 텍스트를 모으는 스트리밍 파서
+
+    컨테이너가 닫히거나 text_budget 글자를 모으면 done 이 됩니다.
+    컨테이너가 없는 페이지를 위해 페이지 전체 텍스트도 예산만큼 모아둡니다.
+    """
+
+    SKIP_TAGS = {'script', 'style', 'noscript'}
+
+    def __init__(self, text_budget):
+        super().__init__(convert_charrefs=True)
+        self.text_budget = text_budget
+        self.main_chunks = []
+        self.main_length = 0
+        self.page_chunks = []
+        self.page_length = 0
+        self.found = False
+        self.done = False
+        self._depth = 0
+        self._skip_depth = 0
+        self._pending = []
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+            return
+        if tag != 'div':
+            return
+        if self._depth:
+            self._depth += 1
+        elif not self.found and _is_main_container(tag, dict(attrs)):
+            self.found = True
+            self._depth = 1
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if tag in self.SKIP_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+            return
+        if tag == 'div' and self._depth:
+            self._depth -= 1
+            if not self._depth:
+                self.done = True
+
+    def handle_data(self, data):
+        # 조각 경계에서 나뉜 텍스트는 다음 태그가 나올 때 하나로 합침
+        if not self._skip_depth and not self.done:
+            self._pending.append(data)
+
+    def _flush_text(self):
+        if not self._pending:
+            return
+        text = ''.join(self._pending).strip()
+        self._pending = []
+        if not text or self.done:
+            return
+        if self._depth:
+            self.main_chunks.append(text)
+            self.main_length += len(text)
+            if self.main_length >= self.text_budget:
+                self.done = True
+        elif self.page_length < self.text_budget:
+            self.page_chunks.append(text)
+            self.page_length += len(text)
+
+    def text(self):
+        self._flush_text()
+        if self.main_length:
+            return '\n'.join(self.main_chunks)
+        return '\n'.join(self.page_chunks)
+
+def read_main_text(response, text_budget, max_bytes, chunk_size=16384):
+    """응답 본문을 조금씩 읽으며 본문 텍스트 추출
+
+    본문 컨테이너에서 text_budget 글자를 얻었거나 컨테이너가 끝나면 읽기를 멈추고,
+    max_bytes 를 넘게 받지 않습니다. (response 는 stream=True 로 요청해야 함)
+    """
+    collector = MainTextCollector(text_budget)
+    # requests 는 charset 이 없으면 ISO-8859-1 로 추정하므로 그 경우 UTF-8 로 읽음
+    encoding = response.encoding
+    if not encoding or encoding.lower() == 'iso-8859-1':
+        encoding = 'utf-8'
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    received = 0
+
+    try:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            received += len(chunk)
+            collector.feed(decoder.decode(chunk))
+            if collector.done or received >= max_bytes:
+                break
+        else:
+            collector.feed(decoder.decode(b'', final=True))
+    finally:
+        response.close()
+
+    return collector.text()
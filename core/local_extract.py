@@ -0,0 +1,93 @@
+"""
+규칙 기반 장단점 추출 (LLM 없이 동작)
+"""
+import re
+from core.condense import CON_CUES, NOISE_CUES, PRO_CUES, split_sentences
+
+# 섹션 제목 → 섹션 종류 (긴 표현부터 확인)
+_SECTION_HEADERS = [
+    (re.compile(r'^\W*(장단점)'), None),
+    (re.compile(r'^\W*(장점|좋은\s*점|좋았던\s*점|만족(스러운|한)\s*점)'), 'pros'),
+    (re.compile(r'^\W*(단점|아쉬운\s*점|아쉬웠던\s*점|불편한\s*점)'), 'cons')
+]
+_BULLET_PATTERN = re.compile(r'^\s*([-•·*▶▷►✔✓☑]|\d+[.)]|[①-⑩])\s*')
+
+def _section_of(sentence):
+    """섹션 제목이면 (True, 'pros'/'cons'/None), 아니면 (False, None)"""
+    if len(sentence) > 20:
+        return False, None
+    for pattern, section in _SECTION_HEADERS:
+        if pattern.match(sentence):
+            return True, section
+    return False, None
+
+def _polarity(sentence):
+    """감성 단서 점수 (양수: 장점, 음수: 단점)"""
+    pro = sum(1 for cue in PRO_CUES if cue in sentence)
+    con = sum(1 for cue in CON_CUES if cue in sentence)
+    return pro - con
+
+def _clean_point(sentence):
+    point = _BULLET_PATTERN.sub('', sentence).strip(' :')
+    if not 5 < len(point) <= 100 or any(cue in point for cue in NOISE_CUES):
+        return None
+    return point
+
+def extract_pros_cons_locally(content, max_points=5):
+    """장점/단점 섹션 제목, 목록, 감성 단서로 장단점 후보 추출
+
+    ({'pros': [...], 'cons': [...]}, 신뢰도 0~1) 을 반환합니다.
+    섹션 아래 목록 항목과 섹션 감성에 맞는 문장은 확실한 근거로, 그 밖의 문장에서
+    감성 단서로 뽑은 항목은 약한 근거로 계산해 신뢰도를 매깁니다.
+    단서 없는 문단이 나오면 섹션이 끝난 것으로 봅니다.
+    """
+    result = {'pros': [], 'cons': []}
+    structured = {'pros': 0, 'cons': 0}
+    section = None
+    in_list = False
+
+    for sentence in split_sentences(content):
+        is_header, header_section = _section_of(sentence)
+        if is_header:
+            section = header_section
+            in_list = False
+            continue
+
+        is_bullet = bool(_BULLET_PATTERN.match(sentence))
+        polarity = _polarity(sentence)
+
+        matches_section = (section == 'pros' and polarity > 0) or (section == 'cons' and polarity < 0)
+        if section and is_bullet:
+            # 섹션 제목 아래 목록 항목
+            in_list = True
+            target = section
+            # 섹션과 반대 감성이 뚜렷하면 따르지 않음 ("장점" 아래 "발열은 아쉽다" 등)
+            if (section == 'pros' and polarity < -1) or (section == 'cons' and polarity > 1):
+                continue
+            strong = True
+        elif section and not in_list and matches_section:
+            # 목록 없이 문단으로 쓴 섹션은 섹션과 감성이 맞는 문장만 인정
+            target = section
+            strong = True
+        else:
+            # 목록이 끝났거나 단서 없는 문단이 나오면 섹션 종료
+            section = None
+            in_list = False
+            if polarity == 0 or len(sentence) > 80:
+                continue
+            target = 'pros' if polarity > 0 else 'cons'
+            strong = False
+
+        point = _clean_point(sentence)
+        if not point or point in result[target] or len(result[target]) >= max_points:
+            continue
+        result[target].append(point)
+        if strong:
+            structured[target] += 1
+
+    # 장점/단점 양쪽이 섹션 근거로 채워질수록 높음 (각각 2개 이상이면 최대)
+    confidence = 0.0
+    for key in ('pros', 'cons'):
+        weak = len(result[key]) - structured[key]
+        confidence += min(structured[key] + 0.3 * weak, 2) / 4
+    return result, round(confidence, 2)
@@ -0,0 +1,114 @@
+"""
+제품명 인덱스 (정규화 + n-gram 유사 검색)
+"""
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from utils.helpers import normalize_product_name
+
+# 같은 모델 번호라도 다른 제품(SKU)을 가리키는 등급/변형 표기
+_TIER_PATTERN = re.compile(r'pro|max|ultra|plus|air|mini|lite|slim|gaming|flip|fold|duo|neo|edge')
+
+def _variant(key):
+    """정규화된 이름에서 숫자(모델 번호/연식)와 등급 표기 추출"""
+    return re.findall(r'\d+', key), sorted(_TIER_PATTERN.findall(key))
+
+class ProductIndex:
+    """DB에 저장된 제품명을 메모리에 색인해 비슷한 검색어를 기존 제품으로 연결"""
+    
+    def __init__(self, ngram=3, threshold=0.75):
+        self.ngram = ngram
+        self.threshold = threshold
+        self.names = {}                    # 정규화된 이름 → DB 제품명
+        self.postings = defaultdict(set)   # n-gram → 정규화된 이름들
+        self.loaded_at = None
+        self._refreshing = False
+        self._attempted_at = 0.0
+        self._lock = threading.Lock()
+    
+    def _grams(self, key):
+        if len(key) <= self.ngram:
+            return {key}
+        return {key[i:i + self.ngram] for i in range(len(key) - self.ngram + 1)}
+    
+    def _insert(self, names, postings, product_name):
+        key = normalize_product_name(product_name)
+        if not key or key in names:
+            return
+        names[key] = product_name
+        for gram in self._grams(key):
+            postings[gram].add(key)
+    
+    def add(self, product_name):
+        """제품명 추가"""
+        with self._lock:
+            self._insert(self.names, self.postings, product_name)
+    
+    def rebuild(self, product_names):
+        """제품명 목록으로 인덱스 재구성 (새로 만든 뒤 교체하므로 조회 중에도 비지 않음)"""
+        names = {}
+        postings = defaultdict(set)
+        for product_name in product_names:
+            self._insert(names, postings, product_name)
+        with self._lock:
+            self.names = names
+            self.postings = postings
+            self.loaded_at = time.time()
+    
+    def refresh_async(self, loader, retry_interval=30):
+        """loader() 의 제품명 목록으로 백그라운드에서 재구성 (이미 진행 중이면 무시)
+        
+        실패하면 retry_interval 초 동안은 다시 시도하지 않습니다.
+        """
+        with self._lock:
+            if self._refreshing or time.time() - self._attempted_at < retry_interval:
+                return
+            self._refreshing = True
+            self._attempted_at = time.time()
+        
+        def run():
+            try:
+                self.rebuild(loader())
+            except Exception as e:
+                print(f"제품명 인덱스 갱신 오류: {str(e)[:100]}")
+            finally:
+                with self._lock:
+                    self._refreshing = False
+        
+        threading.Thread(target=run, name="product-index-refresh", daemon=True).start()
+    
+    def is_stale(self, max_age):
+        return self.loaded_at is None or time.time() - self.loaded_at > max_age
+    
+    def resolve(self, query):
+        """검색어에 해당하는 DB 제품명 반환 (없으면 None)
+        
+        정규화 후 정확히 일치하면 바로 반환하고, 아니면 n-gram Dice 유사도가
+        threshold 이상이면서 숫자(모델 번호/연식)와 등급 표기(pro/max/air ...)가
+        모두 같은 제품을 고릅니다. ("맥북 프로 M3 Max" 는 "맥북 프로 M3" 로 연결되지 않음)
+        """
+        key = normalize_product_name(query)
+        if not key:
+            return None
+        
+        with self._lock:
+            if key in self.names:
+                return self.names[key]
+            
+            grams = self._grams(key)
+            shared = Counter()
+            for gram in grams:
+                for candidate in self.postings.get(gram, ()):
+                    shared[candidate] += 1
+            
+            variant = _variant(key)
+            best_name = None
+            best_score = self.threshold
+            for candidate, count in shared.items():
+                score = 2 * count / (len(grams) + len(self._grams(candidate)))
+                if score >= best_score and _variant(candidate) == variant:
+                    best_name = self.names[candidate]
+                    best_score = score
+            
+            return best_name
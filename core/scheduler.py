@@ -0,0 +1,75 @@
+"""
+크롤링 후보 포스트 우선순위 정렬
+"""
+import math
+from datetime import datetime
+from utils.helpers import normalize_product_name
+
+# 제목/요약에 있으면 장단점 정보가 많을 가능성이 높은 키워드 (가중치)
+REVIEW_KEYWORDS = {
+    '장단점': 2.0,
+    '실사용': 1.5,
+    '단점': 1.5,
+    '사용기': 1.0,
+    '후기': 1.0,
+    '장점': 1.0,
+    '리뷰': 0.5
+}
+
+def post_key(link):
+    """같은 글을 가리키는 링크를 하나로 묶기 위한 키 (blog_id, post_no)"""
+    if "blog.naver.com" in link:
+        parts = link.split('/')
+        if len(parts) >= 5:
+            return (parts[3], parts[4].split('?')[0])
+    return link
+
+def score_post(product_name, post, rank=0, today=None):
+    """검색 결과 요약만으로 포스트의 장단점 정보량 추정"""
+    title = post.get('title', '')
+    description = post.get('description', '')
+    score = 0.0
+
+    # 제품명 일치
+    product_key = normalize_product_name(product_name)
+    if product_key and product_key in normalize_product_name(title):
+        score += 3.0
+    else:
+        tokens = [normalize_product_name(token) for token in product_name.split()]
+        tokens = [token for token in tokens if token]
+        if tokens:
+            title_key = normalize_product_name(title)
+            score += 2.0 * sum(token in title_key for token in tokens) / len(tokens)
+
+    # 리뷰 키워드 (제목은 전체, 요약은 절반 가중치)
+    for keyword, weight in REVIEW_KEYWORDS.items():
+        if keyword in title:
+            score += weight
+        elif keyword in description:
+            score += weight * 0.5
+
+    # 최신 글 우대 (postdate: YYYYMMDD)
+    try:
+        posted = datetime.strptime(post.get('postdate', ''), '%Y%m%d')
+        age_days = max(((today or datetime.now()) - posted).days, 0)
+        score += 1.5 * math.exp(-age_days / 365)
+    except ValueError:
+        pass
+
+    # 검색 순위 (관련도순)
+    score += 1.0 / (rank + 1)
+    return score
+
+def rank_candidates(product_name, search_results):
+    """여러 검색어 결과를 링크 기준으로 합치고 점수 순으로 정렬
+
+    search_results: [검색 결과 items 목록, ...]
+    """
+    candidates = {}
+    for items in search_results:
+        for rank, post in enumerate(items or []):
+            key = post_key(post['link'])
+            score = score_post(product_name, post, rank)
+            if key not in candidates or score > candidates[key][0]:
+                candidates[key] = (score, post)
+    return [post for _, post in sorted(candidates.values(), key=lambda item: -item[0])]
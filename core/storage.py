@@ -0,0 +1,304 @@
+"""
+장단점 저장소 (laptop_pros_cons)
+"""
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from utils.helpers import normalize_product_name
+
+def group_rows(rows):
+    """(type, content, support) 행을 {'pros', 'cons', 'pros_support', 'cons_support'} 로 묶기
+
+    같은 내용은 한 번만 넣고, support 컬럼이 없는 행은 출처 1개로 봅니다.
+    """
+    grouped = {'pros': [], 'cons': [], 'pros_support': [], 'cons_support': []}
+    seen = set()
+    for row in rows:
+        key = (row['type'], row['content'])
+        if key in seen:
+            continue
+        seen.add(key)
+        kind = {'pro': 'pros', 'con': 'cons'}.get(row['type'])
+        if kind:
+            grouped[kind].append(row['content'])
+            grouped[f'{kind}_support'].append(_row_support(row))
+    return grouped
+
+def _row_support(row):
+    try:
+        return row['support'] or 1
+    except (KeyError, IndexError):
+        return 1
+
+class ProsConsStore(ABC):
+    """laptop_pros_cons 저장소 인터페이스 (메서드가 빠진 구현은 생성 시 TypeError)"""
+
+    name = ""
+
+    @abstractmethod
+    def fetch_pros_cons(self, product_name):
+        """제품 장단점을 {'pros', 'cons', 'pros_support', 'cons_support'} 로 반환 (지지 출처 수 순)"""
+
+    @abstractmethod
+    def upsert_rows(self, rows):
+        """{product_name, type, content, content_hash, support} 행 저장 (이미 있으면 support 누적)"""
+
+    @abstractmethod
+    def list_product_names(self):
+        """저장된 제품명 목록"""
+
+class SupabaseStore(ProsConsStore):
+    """Supabase(PostgREST) 저장소"""
+
+    name = "supabase"
+
+    def __init__(self, client, page_size=100, max_rows=300, order_column="id"):
+        self.client = client
+        self.page_size = page_size
+        self.max_rows = max_rows
+        self.order_column = order_column
+        self.schema = "rpc"                # 마이그레이션 누락 감지 시 "upsert" / "insert" / "legacy"
+        self.support_column = True         # support 컬럼이 없는 테이블이면 False
+        self.names_rpc = True              # list_product_names 함수가 없으면 False
+
+    def fetch_pros_cons(self, product_name):
+        """필요한 컬럼만 페이지 단위로 조회 (최대 max_rows 행)"""
+        rows = []
+        start = 0
+
+        while start < self.max_rows:
+            end = min(start + self.page_size, self.max_rows) - 1
+            try:
+                page = self._fetch_page(product_name, start, end)
+            except Exception as e:
+                if not (self.support_column and self._missing_column(e, 'support')):
+                    raise
+                print(f"laptop_pros_cons 에 support 컬럼이 없어 출처 수 없이 조회합니다 (README 마이그레이션 필요): {str(e)[:100]}")
+                self.support_column = False
+                page = self._fetch_page(product_name, start, end)
+            rows.extend(page.data)
+
+            if len(page.data) < end - start + 1:
+                break
+            start = end + 1
+
+        return group_rows(rows)
+
+    def _fetch_page(self, product_name, start, end):
+        query = self.client.table('laptop_pros_cons')
+        if self.support_column:
+            query = query.select('type, content, support').eq('product_name', product_name).order('support', desc=True)
+        else:
+            query = query.select('type, content').eq('product_name', product_name)
+        return query.order(self.order_column).range(start, end).execute()
+
+    def upsert_rows(self, rows):
+        """upsert_pros_cons 함수로 저장 (이미 있는 행은 support 를 더함)
+        
+        README 의 마이그레이션이 적용되지 않은 테이블이면 한 번 감지한 뒤로는
+        함수 없이 (product_name, type, content_hash) unique 제약 업서트(support 누적 없음),
+        제약도 없으면 이미 저장된 내용을 걸러낸 일반 insert 로 저장합니다.
+        """
+        if self.schema == "rpc":
+            try:
+                self.client.rpc('upsert_pros_cons', {'rows': rows}).execute()
+                return
+            except Exception as e:
+                if not self._missing_function(e):
+                    raise
+                print(f"upsert_pros_cons 함수가 없어 출처 수를 누적하지 않고 업서트합니다 (README 마이그레이션 필요): {str(e)[:100]}")
+                self.schema = "upsert"
+
+        if not self.support_column:
+            rows = [{k: v for k, v in row.items() if k != 'support'} for row in rows]
+
+        if self.schema == "upsert":
+            try:
+                self.client.table('laptop_pros_cons').upsert(
+                    rows,
+                    on_conflict='product_name,type,content_hash',
+                    ignore_duplicates=True
+                ).execute()
+                return
+            except Exception as e:
+                if self.support_column and self._missing_column(e, 'support'):
+                    print(f"laptop_pros_cons 에 support 컬럼이 없어 출처 수 없이 저장합니다 (README 마이그레이션 필요): {str(e)[:100]}")
+                    self.support_column = False
+                    return self.upsert_rows(rows)
+                schema = self._legacy_schema(e)
+                if schema is None:
+                    raise
+                print(f"laptop_pros_cons 에 content_hash unique 제약이 없어 insert 로 저장합니다 (README 마이그레이션 필요): {str(e)[:100]}")
+                self.schema = schema
+        
+        self._insert_new(rows)
+    
+    @staticmethod
+    def _missing_column(error, column):
+        code = str(getattr(error, 'code', '') or '')
+        message = str(error)
+        return column in message and (code in ('42703', 'PGRST204') or 'column' in message)
+
+    @staticmethod
+    def _missing_function(error):
+        code = str(getattr(error, 'code', '') or '')
+        return code in ('PGRST202', '42883') or 'Could not find the function' in str(error)
+
+    def _legacy_schema(self, error):
+        """마이그레이션 누락 오류면 'insert' (제약만 없음) / 'legacy' (컬럼도 없음), 아니면 None"""
+        code = str(getattr(error, 'code', '') or '')
+        message = str(error)
+        if self._missing_column(error, 'content_hash'):
+            return 'legacy'
+        if code == '42P10' or 'ON CONFLICT' in message:
+            return 'insert'
+        return None
+    
+    def _insert_new(self, rows):
+        """이미 저장된 (type, content) 를 제외하고 insert"""
+        new_rows = []
+        existing = {}
+        for row in rows:
+            product_name = row['product_name']
+            if product_name not in existing:
+                grouped = self.fetch_pros_cons(product_name)
+                existing[product_name] = (
+                    {('pro', content) for content in grouped['pros']}
+                    | {('con', content) for content in grouped['cons']}
+                )
+            key = (row['type'], row['content'])
+            if key in existing[product_name]:
+                continue
+            existing[product_name].add(key)
+            if self.schema == 'legacy':
+                row = {k: v for k, v in row.items() if k not in ('content_hash', 'support')}
+            new_rows.append(row)
+        
+        if new_rows:
+            self.client.table('laptop_pros_cons').insert(new_rows).execute()
+
+    def list_product_names(self, page_size=1000):
+        """list_product_names 함수로 중복 없는 제품명만 페이지 조회
+
+        함수가 없으면 (README 마이그레이션 전) 전체 행의 product_name 을 정렬해 페이지 조회합니다.
+        """
+        if self.names_rpc:
+            try:
+                return self._page_product_names(
+                    lambda start: self.client.rpc(
+                        'list_product_names', {'page_offset': start, 'page_limit': page_size}
+                    ).execute(),
+                    page_size
+                )
+            except Exception as e:
+                if not self._missing_function(e):
+                    raise
+                print(f"list_product_names 함수가 없어 전체 행에서 제품명을 모읍니다 (README 마이그레이션 필요): {str(e)[:100]}")
+                self.names_rpc = False
+
+        return self._page_product_names(
+            lambda start: (
+                self.client.table('laptop_pros_cons')
+                .select('product_name')
+                .order(self.order_column)
+                .range(start, start + page_size - 1)
+                .execute()
+            ),
+            page_size
+        )
+
+    @staticmethod
+    def _page_product_names(fetch_page, page_size):
+        product_names = set()
+        start = 0
+        while True:
+            page = fetch_page(start)
+            product_names.update(row['product_name'] for row in page.data)
+            if len(page.data) < page_size:
+                break
+            start += page_size
+        return product_names
+
+class SQLiteStore(ProsConsStore):
+    """내장 SQLite 저장소 (WAL, 정규화된 제품명 인덱스)
+
+    외부 서비스 없이 단일 노드에서 동작하며, 정규화된 제품명으로 조회하므로
+    "맥북프로 M3" 와 "MacBook Pro M3" 가 같은 행을 읽습니다.
+    """
+
+    name = "sqlite"
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS laptop_pros_cons (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        product_name TEXT NOT NULL,
+        product_key TEXT NOT NULL,
+        type TEXT NOT NULL,
+        content TEXT NOT NULL,
+        content_hash TEXT NOT NULL,
+        support INTEGER NOT NULL DEFAULT 1,
+        created_at REAL NOT NULL,
+        UNIQUE (product_key, type, content_hash)
+    );
+    CREATE INDEX IF NOT EXISTS idx_laptop_pros_cons_product_key
+        ON laptop_pros_cons (product_key, id);
+    """
+
+    def __init__(self, path, max_rows=300):
+        self.path = path
+        self.max_rows = max_rows
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = self._connection()
+        connection.executescript(self.SCHEMA)
+        # support 컬럼 추가 전에 만든 DB 파일
+        columns = {row['name'] for row in connection.execute("PRAGMA table_info(laptop_pros_cons)")}
+        if 'support' not in columns:
+            connection.execute("ALTER TABLE laptop_pros_cons ADD COLUMN support INTEGER NOT NULL DEFAULT 1")
+            connection.commit()
+
+    def _connection(self):
+        """스레드별 연결"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=10)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def fetch_pros_cons(self, product_name):
+        rows = self._connection().execute(
+            "SELECT type, content, support FROM laptop_pros_cons WHERE product_key = ? "
+            "ORDER BY support DESC, id LIMIT ?",
+            (normalize_product_name(product_name), self.max_rows)
+        ).fetchall()
+        return group_rows(rows)
+
+    def upsert_rows(self, rows):
+        now = time.time()
+        connection = self._connection()
+        with connection:
+            connection.executemany(
+                "INSERT INTO laptop_pros_cons "
+                "(product_name, product_key, type, content, content_hash, support, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (product_key, type, content_hash) "
+                "DO UPDATE SET support = support + excluded.support",
+                [
+                    (row['product_name'], normalize_product_name(row['product_name']),
+                     row['type'], row['content'], row['content_hash'], row.get('support') or 1, now)
+                    for row in rows
+                ]
+            )
+
+    def list_product_names(self):
+        rows = self._connection().execute(
+            "SELECT DISTINCT product_name FROM laptop_pros_cons"
+        ).fetchall()
+        return {row['product_name'] for row in rows}
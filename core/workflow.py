@@ -4,12 +4,24 @@ LangGraph 워크플로우
 from typing import TypedDict, Annotated, List, Union, Dict
 from langgraph.graph import StateGraph, END
 from langchain_core.messages import HumanMessage, AIMessage
+import contextvars
 import operator
+import queue
+import threading
 import streamlit as st
-import time
+from streamlit.runtime.scriptrunner import add_script_run_ctx
 from supabase import create_client
-from config.settings import get_api_keys
+from config.settings import (
+    get_api_keys, RESULT_CACHE_SETTINGS, PRODUCT_INDEX_SETTINGS, SINGLE_FLIGHT_SETTINGS, WRITER_SETTINGS,
+    DB_READ_SETTINGS, STORAGE_SETTINGS
+)
 from core.crawler import ProConsLaptopCrawler
+from core.product_index import ProductIndex
+from core.storage import SupabaseStore, SQLiteStore
+from core.writer import ProsConsWriter
+from utils.cache import TTLCache
+from utils.helpers import normalize_product_name
+from utils.singleflight import SingleFlight
 
 # State 정의
 class SearchState(TypedDict):
@@ -20,9 +32,25 @@ class SearchState(TypedDict):
     pros: List[str]
     cons: List[str]
     sources: List[dict]
+    pros_support: List[int]
+    cons_support: List[int]
     messages: Annotated[List[Union[HumanMessage, AIMessage]], operator.add]
     error: str
 
+# 스트리밍 실행 시 중간 결과를 받을 콜백
+_progress_callback = contextvars.ContextVar("progress_callback", default=None)
+
+def emit_progress(node, pros, cons, sources):
+    """스트리밍 실행 중이면 노드의 중간 결과 전달"""
+    callback = _progress_callback.get()
+    if callback:
+        callback({
+            "node": node,
+            "pros": list(pros),
+            "cons": list(cons),
+            "sources": list(sources)
+        })
+
 # 클라이언트 초기화
 @st.cache_resource
 def get_supabase_client():
@@ -34,12 +62,89 @@ def get_crawler():
     keys = get_api_keys()
     return ProConsLaptopCrawler(keys["NAVER_CLIENT_ID"], keys["NAVER_CLIENT_SECRET"]) if keys["NAVER_CLIENT_ID"] and keys["NAVER_CLIENT_SECRET"] else None
 
+@st.cache_resource
+def get_storage():
+    """장단점 저장소 선택
+    
+    backend 가 "auto" 이면 Supabase 설정이 있을 때 Supabase, 없으면 내장 SQLite 를 사용합니다.
+    """
+    backend = STORAGE_SETTINGS["backend"]
+    if backend in ("auto", "supabase"):
+        supabase = get_supabase_client()
+        if supabase:
+            return SupabaseStore(
+                supabase,
+                page_size=DB_READ_SETTINGS["page_size"],
+                max_rows=DB_READ_SETTINGS["max_rows"],
+                order_column=DB_READ_SETTINGS["order_column"]
+            )
+        if backend == "supabase":
+            return None
+    return SQLiteStore(STORAGE_SETTINGS["sqlite_path"], max_rows=DB_READ_SETTINGS["max_rows"])
+
+@st.cache_resource
+def get_writer():
+    """laptop_pros_cons write-behind 저장기 (프로세스 전체 공유)"""
+    store = get_storage()
+    return ProsConsWriter(
+        store,
+        batch_size=WRITER_SETTINGS["batch_size"],
+        flush_interval=WRITER_SETTINGS["flush_interval"],
+        max_attempts=WRITER_SETTINGS["max_attempts"]
+    ) if store else None
+
+@st.cache_resource
+def get_result_cache():
+    """최종 장단점 결과 캐시 (프로세스 전체 공유)"""
+    return TTLCache(
+        max_items=RESULT_CACHE_SETTINGS["max_items"],
+        ttl=RESULT_CACHE_SETTINGS["ttl"]
+    )
+
+@st.cache_resource
+def get_product_index():
+    """DB 제품명 인덱스 (프로세스 전체 공유, 생성 시 백그라운드 적재 시작)"""
+    index = ProductIndex(
+        ngram=PRODUCT_INDEX_SETTINGS["ngram"],
+        threshold=PRODUCT_INDEX_SETTINGS["threshold"]
+    )
+    store = get_storage()
+    if store:
+        index.refresh_async(store.list_product_names)
+    return index
+
+def resolve_product_name(store, product_name):
+    """검색어를 DB에 있는 제품명으로 연결 (없으면 검색어 그대로)
+    
+    제품명 목록 재적재는 백그라운드에서 하므로 요청은 기존 인덱스로 바로 처리합니다.
+    """
+    index = get_product_index()
+    if index.is_stale(PRODUCT_INDEX_SETTINGS["refresh_interval"]):
+        index.refresh_async(store.list_product_names)
+    return index.resolve(product_name) or product_name
+
 def search_database(state: SearchState) -> SearchState:
     """데이터베이스에서 제품 검색"""
     product_name = state["product_name"]
-    supabase = get_supabase_client()
     
-    if not supabase:
+    cached = get_result_cache().get(normalize_product_name(product_name))
+    if cached:
+        state["search_method"] = "database"
+        state["results"] = {"data": None, "cached": True}
+        state["pros"] = list(cached["pros"])
+        state["cons"] = list(cached["cons"])
+        state["sources"] = list(cached["sources"])
+        state["pros_support"] = list(cached["pros_support"])
+        state["cons_support"] = list(cached["cons_support"])
+        state["messages"].append(
+            AIMessage(content=f"⚡ 캐시에서 '{product_name}' 정보를 찾았습니다!")
+        )
+        emit_progress("search_db", state["pros"], state["cons"], state["sources"])
+        return state
+    
+    store = get_storage()
+    
+    if not store:
         state["messages"].append(
             AIMessage(content="⚠️ 데이터베이스가 설정되지 않았습니다. 웹 검색으로 진행합니다.")
         )
@@ -51,13 +156,20 @@ def search_database(state: SearchState) -> SearchState:
     )
     
     try:
-        exact_match = supabase.table('laptop_pros_cons').select("*").eq('product_name', product_name).execute()
-        if exact_match.data:
+        db_product_name = resolve_product_name(store, product_name)
+        if db_product_name != product_name:
+            state["messages"].append(
+                AIMessage(content=f"🔎 '{product_name}' → '{db_product_name}'(으)로 검색합니다")
+            )
+        
+        grouped = store.fetch_pros_cons(db_product_name)
+        if grouped['pros'] or grouped['cons']:
             state["search_method"] = "database"
-            state["results"] = {"data": exact_match.data}
+            state["results"] = {"data": grouped}
             state["messages"].append(
-                AIMessage(content=f"✅ 데이터베이스에서 '{product_name}' 정보를 찾았습니다! ({len(exact_match.data)}개 항목)")
+                AIMessage(content=f"✅ 데이터베이스에서 '{product_name}' 정보를 찾았습니다! ({len(grouped['pros']) + len(grouped['cons'])}개 항목)")
             )
+            emit_progress("search_db", grouped['pros'], grouped['cons'], [])
             return state
         
         state["messages"].append(
@@ -74,6 +186,138 @@ def search_database(state: SearchState) -> SearchState:
         state["results"] = {"data": None}
         return state
 
+@st.cache_resource
+def get_crawl_flight():
+    """제품별 크롤링 single-flight (프로세스 내 + 잠금 파일로 프로세스 간)"""
+    return SingleFlight(
+        SINGLE_FLIGHT_SETTINGS["directory"],
+        lease_ttl=SINGLE_FLIGHT_SETTINGS["lease_ttl"],
+        wait_timeout=SINGLE_FLIGHT_SETTINGS["wait_timeout"],
+        poll_interval=SINGLE_FLIGHT_SETTINGS["poll_interval"],
+        result_ttl=SINGLE_FLIGHT_SETTINGS["result_ttl"]
+    )
+
+def crawl_product(crawler, product_name, on_result=None):
+    """웹에서 장단점을 수집하고 DB에 저장
+    
+    {"pros", "cons", "sources", "messages", "saved"} 를 반환합니다.
+    """
+    all_pros = []
+    all_cons = []
+    pro_sources = []
+    con_sources = []
+    sources = []
+    tentative_sources = set()   # 신뢰도가 낮은 규칙 기반 추출 (저장하지 않음)
+    messages = []
+    
+    search_queries = [
+        f"{product_name} 장단점 실사용",
+        f"{product_name} 단점 후기",
+        f"{product_name} 장점 리뷰"
+    ]
+    
+    # 검색/수집/추출을 병렬 파이프라인으로 실행
+    collected = crawler.collect_pros_cons(product_name, search_queries, on_result=on_result)
+    
+    for query, found in collected['searches']:
+        messages.append(f"🔍 검색어: '{query}'")
+        if found is not None:
+            messages.append(f"→ {found}개 포스트 발견")
+    
+    messages.append(f"🧭 중복을 제외한 후보 {collected['candidates']}개를 장단점 정보가 많아 보이는 순으로 분석")
+    
+    for post, pros_cons in zip(collected['posts'], collected['extractions']):
+        messages.append(f"📖 분석 중: {post['title'][:40]}...")
+        
+        if pros_cons:
+            source_id = len(sources)
+            all_pros.extend(pros_cons['pros'])
+            all_cons.extend(pros_cons['cons'])
+            pro_sources.extend([source_id] * len(pros_cons['pros']))
+            con_sources.extend([source_id] * len(pros_cons['cons']))
+            if pros_cons.get('tentative'):
+                tentative_sources.add(source_id)
+            sources.append({
+                'title': post['title'],
+                'link': post['link'],
+                'date': post.get('postdate', '')
+            })
+            
+            messages.append(f"✓ 장점 {len(pros_cons['pros'])}개, 단점 {len(pros_cons['cons'])}개 추출")
+    
+    if collected['skipped']:
+        messages.append(f"⏹ 목표 수집량을 채워 나머지 포스트 {collected['skipped']}개는 건너뛰었습니다")
+    
+    # 같은 의미의 장단점을 묶어 언급한 출처 수 순으로 정렬
+    pros, pros_support = crawler.aggregate_points(all_pros, pro_sources)
+    cons, cons_support = crawler.aggregate_points(all_cons, con_sources)
+    
+    result = {
+        "pros": pros,
+        "cons": cons,
+        "pros_support": pros_support,
+        "cons_support": cons_support,
+        "sources": sources[:10],
+        "messages": messages,
+        "saved": False
+    }
+    
+    if not (result["pros"] or result["cons"]):
+        messages.append(f"😢 '{product_name}'에 대한 정보를 찾을 수 없습니다.")
+        return result
+    
+    messages.append(f"🎉 웹 크롤링 완료! 총 장점 {len(result['pros'])}개, 단점 {len(result['cons'])}개 수집")
+    
+    # 신뢰도가 낮은 규칙 기반 결과는 화면에만 보여주고 DB에는 확실한 출처의 장단점만 저장
+    saved_pros, saved_cons = result["pros"], result["cons"]
+    saved_pros_support, saved_cons_support = pros_support, cons_support
+    if tentative_sources:
+        saved_pros, saved_pros_support = crawler.aggregate_points(
+            [pro for pro, source in zip(all_pros, pro_sources) if source not in tentative_sources],
+            [source for source in pro_sources if source not in tentative_sources]
+        )
+        saved_cons, saved_cons_support = crawler.aggregate_points(
+            [con for con, source in zip(all_cons, con_sources) if source not in tentative_sources],
+            [source for source in con_sources if source not in tentative_sources]
+        )
+        messages.append(f"ℹ️ 신뢰도가 낮은 규칙 기반 추출 {len(tentative_sources)}건은 저장하지 않습니다")
+    
+    # DB에 저장
+    try:
+        writer = get_writer()
+        if writer:
+            data = []
+            
+            for pro, support in zip(saved_pros, saved_pros_support):
+                data.append({
+                    'product_name': product_name,
+                    'type': 'pro',
+                    'content': pro,
+                    'support': support
+                })
+            
+            for con, support in zip(saved_cons, saved_cons_support):
+                data.append({
+                    'product_name': product_name,
+                    'type': 'con',
+                    'content': con,
+                    'support': support
+                })
+            
+            if data:
+                # 응답을 기다리지 않도록 백그라운드 배치 업서트로 저장
+                writer.enqueue(data)
+                get_result_cache().delete(normalize_product_name(product_name))
+                get_product_index().add(product_name)
+                messages.append("💾 데이터베이스 저장을 예약했습니다!")
+                result["saved"] = True
+            if writer.dropped:
+                messages.append(f"⚠️ 이전 DB 저장 중 {writer.dropped}개 행을 저장하지 못했습니다: {str(writer.last_error)[:100]}")
+    except Exception as e:
+        messages.append(f"⚠️ DB 저장 실패: {str(e)}")
+    
+    return result
+
 def crawl_web(state: SearchState) -> SearchState:
     """웹에서 제품 정보 크롤링"""
     if state["results"].get("data"):
@@ -93,9 +337,60 @@ def crawl_web(state: SearchState) -> SearchState:
         HumanMessage(content=f"🌐 웹에서 '{product_name}' 리뷰 수집 시작...")
     )
     
-    # API 키가 없을 때 샘플 데이터
+    # OpenAI 키가 없으면 규칙 기반 추출만 사용
     keys = get_api_keys()
     if not keys["OPENAI_API_KEY"]:
+        state["messages"].append(
+            AIMessage(content="🧩 OpenAI API 키가 없어 규칙 기반 추출로 분석합니다")
+        )
+    
+    # 포스트별 추출 결과를 바로 전달 (스트리밍 실행 시)
+    progress_callback = _progress_callback.get()
+    if progress_callback:
+        partial = {"pros": [], "cons": [], "sources": []}
+        partial_lock = threading.Lock()
+        
+        def report_result(post, pros_cons):
+            with partial_lock:
+                partial["pros"].extend(pros_cons['pros'])
+                partial["cons"].extend(pros_cons['cons'])
+                partial["sources"].append({
+                    'title': post['title'],
+                    'link': post['link'],
+                    'date': post.get('postdate', '')
+                })
+                progress_callback({
+                    "node": "crawl_web",
+                    "pros": crawler.deduplicate_points(partial["pros"]),
+                    "cons": crawler.deduplicate_points(partial["cons"]),
+                    "sources": list(partial["sources"])
+                })
+        
+        on_result = report_result
+    else:
+        on_result = None
+    
+    # 같은 제품의 동시 크롤링은 한 번만 실행하고 결과 공유
+    crawl_result, shared = get_crawl_flight().do(
+        normalize_product_name(product_name),
+        lambda: crawl_product(crawler, product_name, on_result)
+    )
+    
+    if shared:
+        state["messages"].append(
+            AIMessage(content=f"🤝 다른 검색에서 수집한 '{product_name}' 결과를 함께 사용합니다")
+        )
+    for message in crawl_result["messages"]:
+        state["messages"].append(AIMessage(content=message))
+    
+    state["pros"] = list(crawl_result["pros"])
+    state["cons"] = list(crawl_result["cons"])
+    state["sources"] = list(crawl_result["sources"])
+    state["pros_support"] = list(crawl_result["pros_support"])
+    state["cons_support"] = list(crawl_result["cons_support"])
+    
+    # 규칙 기반 추출로도 찾지 못했으면 샘플 데이터 표시
+    if not keys["OPENAI_API_KEY"] and not (state["pros"] or state["cons"]):
         state["pros"] = [
             "가볍고 휴대성이 좋습니다",
             "배터리 지속 시간이 깁니다",
@@ -108,135 +403,60 @@ def crawl_web(state: SearchState) -> SearchState:
             "포트가 부족합니다",
             "키보드 키감이 아쉽습니다"
         ]
+        state["results"]["sample"] = True
         state["messages"].append(
             AIMessage(content="📌 샘플 데이터를 표시합니다 (API 키 설정 필요)")
         )
         return state
     
-    all_pros = []
-    all_cons = []
-    sources = []
-    
-    search_queries = [
-        f"{product_name} 장단점 실사용",
-        f"{product_name} 단점 후기",
-        f"{product_name} 장점 리뷰"
-    ]
-    
-    for query in search_queries:
-        state["messages"].append(
-            AIMessage(content=f"🔍 검색어: '{query}'")
-        )
-        
-        result = crawler.search_blog(query, display=10)
-        if not result or 'items' not in result:
-            continue
-        
-        posts = result['items']
-        state["messages"].append(
-            AIMessage(content=f"→ {len(posts)}개 포스트 발견")
-        )
-        
-        for idx, post in enumerate(posts[:5]):
-            state["messages"].append(
-                AIMessage(content=f"📖 분석 중: {post['title'][:40]}...")
-            )
-            
-            content = crawler.crawl_content(post['link'])
-            if not content:
-                continue
-            
-            crawler.stats['total_crawled'] += 1
-            
-            pros_cons = crawler.extract_pros_cons_with_gpt(product_name, content)
-            
-            if pros_cons:
-                all_pros.extend(pros_cons['pros'])
-                all_cons.extend(pros_cons['cons'])
-                sources.append({
-                    'title': post['title'],
-                    'link': post['link'],
-                    'date': post.get('postdate', '')
-                })
-                
-                state["messages"].append(
-                    AIMessage(content=f"✓ 장점 {len(pros_cons['pros'])}개, 단점 {len(pros_cons['cons'])}개 추출")
-                )
-            
-            time.sleep(1)
-        
-        time.sleep(2)
-    
-    unique_pros = crawler.deduplicate_points(all_pros)
-    unique_cons = crawler.deduplicate_points(all_cons)
-    
-    state["pros"] = unique_pros
-    state["cons"] = unique_cons
-    state["sources"] = sources[:10]
-    
-    if state["pros"] or state["cons"]:
-        state["messages"].append(
-            AIMessage(content=f"🎉 웹 크롤링 완료! 총 장점 {len(state['pros'])}개, 단점 {len(state['cons'])}개 수집")
-        )
-        
-        # DB에 저장
-        try:
-            supabase = get_supabase_client()
-            if supabase:
-                data = []
-                
-                for pro in state["pros"]:
-                    data.append({
-                        'product_name': product_name,
-                        'type': 'pro',
-                        'content': pro
-                    })
-                
-                for con in state["cons"]:
-                    data.append({
-                        'product_name': product_name,
-                        'type': 'con',
-                        'content': con
-                    })
-                
-                if data:
-                    supabase.table('laptop_pros_cons').insert(data).execute()
-                    state["messages"].append(
-                        AIMessage(content="💾 데이터베이스에 저장 완료!")
-                    )
-                    st.session_state.saved_products += 1
-        except Exception as e:
-            state["messages"].append(
-                AIMessage(content=f"⚠️ DB 저장 실패: {str(e)}")
-            )
-    else:
-        state["messages"].append(
-            AIMessage(content=f"😢 '{product_name}'에 대한 정보를 찾을 수 없습니다.")
-        )
+    if crawl_result["saved"] and not shared:
+        st.session_state.saved_products += 1
     
     state["messages"].append(
-        AIMessage(content=f"📊 크롤링 통계: 총 {crawler.stats['total_crawled']}개 페이지, 유효 추출 {crawler.stats['valid_pros_cons']}개")
+        AIMessage(content=f"📊 크롤링 통계: 총 {crawler.stats['total_crawled']}개 페이지, 유효 추출 {crawler.stats['valid_pros_cons']}개 (규칙 기반 {crawler.stats['local_extractions']}개), 속도 제한 대기 {crawler.stats['rate_limit_wait_seconds']:.1f}초")
     )
     
+    # 호스트별 속도 제한 대기 (프로세스 전체 누적)
+    waits = [
+        f"{host} {count}회/{seconds:.1f}초"
+        for host, (count, seconds) in sorted(crawler.rate_limit_waits().items()) if count
+    ]
+    if waits:
+        state["messages"].append(AIMessage(content=f"⏱ 호스트별 대기: {', '.join(waits)}"))
+    
     return state
 
 def process_results(state: SearchState) -> SearchState:
     """결과 처리 및 정리"""
     if state["search_method"] == "database" and state["results"].get("data"):
         data = state["results"]["data"]
-        state["pros"] = [item['content'] for item in data if item['type'] == 'pro']
-        state["cons"] = [item['content'] for item in data if item['type'] == 'con']
+        state["pros"] = list(data['pros'])
+        state["cons"] = list(data['cons'])
         state["sources"] = []
+        state["pros_support"] = list(data.get('pros_support') or [])
+        state["cons_support"] = list(data.get('cons_support') or [])
         
         state["messages"].append(
             AIMessage(content=f"📋 결과 정리 완료: 장점 {len(state['pros'])}개, 단점 {len(state['cons'])}개")
         )
     
+    # 최종 결과 캐시 (캐시 적중/샘플 데이터 제외)
+    results = state["results"]
+    if (state["pros"] or state["cons"]) and not results.get("cached") and not results.get("sample"):
+        get_result_cache().set(normalize_product_name(state["product_name"]), {
+            "pros": list(state["pros"]),
+            "cons": list(state["cons"]),
+            "sources": list(state["sources"]),
+            "pros_support": list(state.get("pros_support") or []),
+            "cons_support": list(state.get("cons_support") or [])
+        })
+    
+    emit_progress("process", state["pros"], state["cons"], state["sources"])
     return state
 
 def should_search_web(state: SearchState) -> str:
     """웹 검색이 필요한지 판단"""
-    if state["results"].get("data"):
+    if state["results"].get("data") or state["results"].get("cached"):
         return "process"
     else:
         return "crawl"
@@ -265,3 +485,37 @@ def create_search_workflow():
     workflow.add_edge("process", END)
     
     return workflow.compile()
+
+def stream_search(search_app, initial_state):
+    """워크플로우를 백그라운드 스레드에서 실행하며 중간 결과를 순서대로 반환
+    
+    {"node", "pros", "cons", "sources"} 형태의 중간 결과를 내보내고,
+    마지막에 {"node": "__end__", "final": True, "state": 최종 상태} 를 반환합니다.
+    """
+    events = queue.Queue()
+    outcome = {}
+    
+    def run():
+        _progress_callback.set(events.put)
+        try:
+            outcome["state"] = search_app.invoke(initial_state)
+        except Exception as e:
+            outcome["error"] = e
+        finally:
+            events.put(None)
+    
+    thread = threading.Thread(target=run, daemon=True)
+    add_script_run_ctx(thread)
+    thread.start()
+    
+    while True:
+        event = events.get()
+        if event is None:
+            break
+        yield event
+    
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    
+    yield {"node": "__end__", "final": True, "state": outcome["state"]}
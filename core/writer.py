@@ -0,0 +1,94 @@
+"""
+장단점 DB 저장 (write-behind 배치 업서트)
+"""
+import atexit
+import hashlib
+import re
+import threading
+
+def content_hash(content):
+    """중복 판단용 본문 해시 (공백 차이는 무시)"""
+    normalized = re.sub(r'\s+', ' ', content).strip()
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+class ProsConsWriter:
+    """laptop_pros_cons 행을 모아 백그라운드에서 한 번에 업서트
+
+    (product_name, type, content_hash) 기준으로 중복을 제거하므로 같은 결과를
+    여러 번 넣어도 행이 늘어나지 않고 support(지지 출처 수)만 더해집니다. Supabase 를 쓰는 경우 테이블에 해당
+    컬럼 조합의 unique 제약이 필요합니다 (README 참고).
+    """
+
+    def __init__(self, store, batch_size=200, flush_interval=2.0, max_attempts=3):
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self._buffer = {}                  # dedup 키 → (row, 시도 횟수)
+        self.dropped = 0                   # 재시도 끝에 저장하지 못한 행 수
+        self.last_error = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="pros-cons-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def enqueue(self, rows):
+        """저장할 행 추가 (즉시 반환). 새로 추가된 행 수를 반환"""
+        added = 0
+        with self._lock:
+            for row in rows:
+                row = dict(
+                    row,
+                    content_hash=row.get('content_hash') or content_hash(row['content']),
+                    support=row.get('support') or 1
+                )
+                key = (row['product_name'], row['type'], row['content_hash'])
+                if key in self._buffer:
+                    # 저장 전에 같은 행이 또 들어오면 지지 출처 수만 더함
+                    buffered, attempts = self._buffer[key]
+                    self._buffer[key] = (dict(buffered, support=buffered['support'] + row['support']), attempts)
+                else:
+                    self._buffer[key] = (row, 0)
+                    added += 1
+            if len(self._buffer) >= self.batch_size:
+                self._wakeup.set()
+        return added
+
+    def pending(self):
+        with self._lock:
+            return len(self._buffer)
+
+    def flush(self):
+        """버퍼의 행을 배치 단위로 업서트"""
+        with self._lock:
+            items = list(self._buffer.items())
+            self._buffer.clear()
+
+        for start in range(0, len(items), self.batch_size):
+            batch = items[start:start + self.batch_size]
+            try:
+                self.store.upsert_rows([row for _, (row, _) in batch])
+            except Exception as e:
+                print(f"DB 저장 오류: {str(e)[:100]}")
+                self.last_error = str(e)
+                self._requeue(batch)
+
+    def _requeue(self, batch):
+        """실패한 행을 다시 버퍼에 넣음 (최대 시도 횟수를 넘으면 버리고 dropped 에 집계)"""
+        with self._lock:
+            for key, (row, attempts) in batch:
+                if attempts + 1 < self.max_attempts:
+                    if key in self._buffer:
+                        buffered, _ = self._buffer[key]
+                        row = dict(row, support=row['support'] + buffered['support'])
+                    self._buffer[key] = (row, attempts + 1)
+                else:
+                    self.dropped += 1
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self.pending():
+                self.flush()
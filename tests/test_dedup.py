@@ -0,0 +1,31 @@
+from core.dedup import MinHashDeduplicator
+
+SUBJECTS = [
+    '발열', '포트', '배터리', '화면', '키보드', '트랙패드', '스피커', '무게', '팬 소음', '충전기',
+    '힌지', '웹캠', '마이크', '가격', '디자인', '마감', '냉각', 'SSD', '메모리', '터치패드'
+]
+PREDICATES = [
+    '이 불편합니다', '이 아쉬워요', '이 좋아요', '이 생각보다 별로입니다',
+    '이 만족스럽습니다', '이 너무 심해서 실망했어요', '이 기대 이상으로 훌륭합니다', '이 가격 대비 괜찮아요'
+]
+
+def test_same_predicate_different_subject_stay_apart():
+    points = [subject + predicate for subject in SUBJECTS for predicate in PREDICATES]
+    clusters, _ = MinHashDeduplicator().cluster(points)
+    assert len(clusters) == len(points)
+
+def test_numeric_variants_stay_apart():
+    points = [f'배터리가 {hours}시간 갑니다' for hours in range(300)]
+    clusters, _ = MinHashDeduplicator().cluster(points)
+    assert len(clusters) == len(points)
+
+def test_near_duplicates_merge_without_chaining():
+    points = ['배터리가 오래 가요', '화면이 선명해요', '배터리가 오래가요', '배터리가 오래 가서 좋아요']
+    clusters, _ = MinHashDeduplicator().cluster(points)
+    assert clusters == [[0, 2, 3], [1]]
+
+def test_aggregate_counts_distinct_sources():
+    points = ['배터리가 오래 가요', '배터리가 오래가요', '배터리가 오래 가요', '발열이 심해요']
+    ranked = MinHashDeduplicator().aggregate(points, ['a', 'b', 'b', 'a'])
+    assert [support for _, support in ranked] == [2, 1]
+    assert ranked[1][0] == '발열이 심해요'
@@ -0,0 +1,39 @@
+from core.local_extract import extract_pros_cons_locally
+
+def test_diary_lines_under_headers_are_not_confident():
+    content = (
+        "장점\n"
+        "지난 주말에 백화점에 다녀왔습니다.\n"
+        "저녁으로는 치킨을 먹었습니다.\n"
+        "단점\n"
+        "이웃 여러분 다음 글에서 만나요."
+    )
+    result, confidence = extract_pros_cons_locally(content)
+    assert result == {'pros': [], 'cons': []}
+    assert confidence < 0.7
+
+def test_bulleted_sections_are_confident():
+    content = (
+        "장점\n"
+        "- 배터리가 하루 종일 갑니다\n"
+        "- 화면이 선명하고 밝아요\n"
+        "단점\n"
+        "- 팬 소음이 꽤 큰 편입니다\n"
+        "- 포트 구성이 부족해요"
+    )
+    result, confidence = extract_pros_cons_locally(content)
+    assert result['pros'] == ['배터리가 하루 종일 갑니다', '화면이 선명하고 밝아요']
+    assert result['cons'] == ['팬 소음이 꽤 큰 편입니다', '포트 구성이 부족해요']
+    assert confidence >= 0.7
+
+def test_section_ends_at_paragraph_without_cue():
+    content = (
+        "장점\n"
+        "무게가 가벼워서 들고 다니기 좋아요.\n"
+        "다음에는 카페에서 찍은 사진을 올릴게요.\n"
+        "그날 날씨가 참 맑았습니다."
+    )
+    result, confidence = extract_pros_cons_locally(content)
+    assert result['pros'] == ['무게가 가벼워서 들고 다니기 좋아요.']
+    assert result['cons'] == []
+    assert confidence < 0.7
@@ -0,0 +1,197 @@
+"""
+디스크 캐시 유틸리티
+"""
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+class DiskCache:
+    """여러 프로세스가 공유할 수 있는 파일 기반 캐시
+
+    - 항목별 TTL 만료
+    - 전체 용량 제한 (가장 오래 사용되지 않은 항목부터 삭제)
+    - 임시 파일 + os.replace 로 원자적 쓰기
+    - 선택적 프로세스 내 메모리 LRU (memory_items > 0)
+    """
+
+    def __init__(self, directory, ttl=None, max_bytes=None, memory_items=0):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._approx_bytes = None
+        os.makedirs(directory, exist_ok=True)
+
+    def _memory_get(self, path):
+        if not self.memory_items:
+            return None
+        with self._lock:
+            entry = self._memory.get(path)
+            if entry is None:
+                return None
+            if entry[0] is not None and entry[0] < time.time():
+                del self._memory[path]
+                return None
+            self._memory.move_to_end(path)
+            return entry
+
+    def _memory_set(self, path, expires_at, value):
+        if not self.memory_items:
+            return
+        with self._lock:
+            self._memory[path] = (expires_at, value)
+            self._memory.move_to_end(path)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+
+    def _path(self, key):
+        """키를 해시해서 파일 경로로 변환"""
+        raw = json.dumps(key, ensure_ascii=False, sort_keys=True, default=str)
+        digest = hashlib.sha256(raw.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest[:2], f"{digest}.cache")
+
+    def get(self, key, default=None):
+        """캐시 조회 (만료된 항목은 삭제)"""
+        path = self._path(key)
+        entry = self._memory_get(path)
+        if entry is not None:
+            return entry[1]
+
+        try:
+            with open(path, 'rb') as f:
+                expires_at, value = pickle.load(f)
+        except FileNotFoundError:
+            return default
+        except Exception:
+            self._remove(path)
+            return default
+
+        if expires_at is not None and expires_at < time.time():
+            self._remove(path)
+            return default
+
+        # LRU 기준 시각 갱신
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        self._memory_set(path, expires_at, value)
+        return value
+
+    def set(self, key, value, ttl=None):
+        """캐시 저장 (원자적 쓰기)"""
+        path = self._path(key)
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = time.time() + ttl if ttl else None
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((expires_at, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception:
+            self._remove(tmp_path)
+            raise
+        self._memory_set(path, expires_at, value)
+
+        if self.max_bytes:
+            self._track_size(os.path.getsize(path))
+
+    def delete(self, key):
+        """캐시 항목 삭제"""
+        path = self._path(key)
+        with self._lock:
+            self._memory.pop(path, None)
+        self._remove(path)
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _entries(self):
+        """(경로, 크기, 마지막 사용 시각) 목록"""
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith('.cache'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _track_size(self, added_bytes):
+        """대략적인 전체 용량을 추적하고 초과 시 정리"""
+        with self._lock:
+            if self._approx_bytes is None:
+                self._approx_bytes = sum(size for _, size, _ in self._entries())
+            else:
+                self._approx_bytes += added_bytes
+
+            if self._approx_bytes > self.max_bytes:
+                self._approx_bytes = self._evict()
+
+    def _evict(self):
+        """가장 오래 사용되지 않은 항목부터 삭제 (용량의 90%까지)"""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            self._remove(path)
+            total -= size
+
+        return total
+
+class TTLCache:
+    """프로세스 내 메모리 캐시 (TTL + LRU 개수 제한, 스레드 안전)"""
+
+    def __init__(self, max_items=256, ttl=None):
+        self.max_items = max_items
+        self.ttl = ttl
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.time():
+                del self._items[key]
+                return default
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._items[key] = (expires_at, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
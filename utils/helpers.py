@@ -6,7 +6,12 @@ import os
 import urllib.request
 import urllib.parse
 import re
-from collections import Counter
+import unicodedata
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+from config.settings import KEYWORD_SETTINGS
+from utils.korean import get_tokenizer
 
 @st.cache_resource
 def ensure_font():
@@ -50,70 +55,112 @@ def show_loading_animation():
     """, unsafe_allow_html=True)
     return loading_placeholder
 
+# 키워드 불용어 (모듈 로드 시 한 번만 생성)
+KEYWORD_STOPWORDS = frozenset({
+    # 일반 불용어
+    '수', '있습니다', '있어요', '있음', '좋습니다', '좋아요', '좋음', 
+    '나쁩니다', '나빠요', '나쁨', '않습니다', '않아요', '않음',
+    '입니다', '이다', '되다', '하다', '있다', '없다', '같다',
+    '위해', '통해', '대해', '매우', '정말', '너무', '조금',
+    '그리고', '하지만', '그러나', '또한', '때문', '경우',
+    '제공합니다', '제공', '합니다', '해요', '드립니다', '드려요',
+    '위한', '위하여', '따라', '따른', '통한', '대한', '관한',
+    '됩니다', '됨', '되어', '되었습니다', '했습니다', '하는',
+    '이', '그', '저', '것', '것이', '것을', '것은', '것도',
+    '더', '덜', '꽤', '약간', '살짝', '많이', '적게', '조금',
+    '모든', '각', '각각', '여러', '몇', '몇몇', '전체', '일부',
+    '항상', '가끔', '종종', '자주', '언제나', '절대', '전혀',
+    '만', '도', '까지', '부터', '에서', '에게', '으로', '로',
+    '와', '과', '하고', '이고', '이며', '거나', '든지', '라고',
+    '들', '등', '등등', '따위', '및', '또는', '혹은', '즉',
+    '의', '를', '을', '에', '가', '이', '은', '는', '와', '과',
+    '했다', '한다', '하며', '하여', '해서', '하고', '하니', '하면',
+    '그래서', '그러니', '그러므로', '따라서', '때문에', '왜냐하면',
+    '비해', '보다', '처럼', '같이', '만큼', '대로', '듯이',
+    '점', '면', '측면', '부분', '경우', '상황', '상태', '정도',
+    '이런', '저런', '그런', '어떤', '무슨', '어느', '어떻게',
+    '가능', '불가능', '필요', '불필요', '중요', '사용', '이용',
+    '느낌', '기분', '마음', '생각', '의견', '감정', '인상',
+    '한', '두', '세', '네', '몇', '여러', '많은', '적은',
+    '첫', '둘', '셋', '넷', '첫째', '둘째', '셋째', '마지막',
+    '좀', '꼭', '딱', '막', '참', '진짜', '정말로', '확실히',
+    '거의', '대부분', '대체로', '보통', '일반적', '평균적',
+    '특히', '특별히', '주로', '대개', '대체로', '전반적'
+})
+
+# 서술어로 끝나거나 용언/부정어 활용형("하는", "있어요", "않고")인 단어 제외
+# ("하드웨어", "하루" 처럼 같은 글자로 시작하는 명사는 남김)
+_EXCLUDED_WORD_PATTERN = re.compile(
+    r'^(?:있|없|하|되|않|했|됐)(?:[다어아고는은을게지면서니며음요네죠았었였해했겠]|$)'
+    r'|(?:습니다|합니다|입니다|됩니다)$'
+)
+
+# 같은 텍스트의 키워드는 한 번만 계산 (본문 해시 → Counter)
+_KEYWORD_CACHE = OrderedDict()
+_KEYWORD_CACHE_SIZE = 256
+_keyword_cache_lock = threading.Lock()
+
 def extract_keywords(texts):
-    """텍스트에서 핵심 키워드 추출"""
-    # 확장된 불용어 정의
-    stopwords = {
-        # 일반 불용어
-        '수', '있습니다', '있어요', '있음', '좋습니다', '좋아요', '좋음', 
-        '나쁩니다', '나빠요', '나쁨', '않습니다', '않아요', '않음',
-        '입니다', '이다', '되다', '하다', '있다', '없다', '같다',
-        '위해', '통해', '대해', '매우', '정말', '너무', '조금',
-        '그리고', '하지만', '그러나', '또한', '때문', '경우',
-        '제공합니다', '제공', '합니다', '해요', '드립니다', '드려요',
-        '위한', '위하여', '따라', '따른', '통한', '대한', '관한',
-        '됩니다', '됨', '되어', '되었습니다', '했습니다', '하는',
-        '이', '그', '저', '것', '것이', '것을', '것은', '것도',
-        '더', '덜', '꽤', '약간', '살짝', '많이', '적게', '조금',
-        '모든', '각', '각각', '여러', '몇', '몇몇', '전체', '일부',
-        '항상', '가끔', '종종', '자주', '언제나', '절대', '전혀',
-        '만', '도', '까지', '부터', '에서', '에게', '으로', '로',
-        '와', '과', '하고', '이고', '이며', '거나', '든지', '라고',
-        '들', '등', '등등', '따위', '및', '또는', '혹은', '즉',
-        '의', '를', '을', '에', '가', '이', '은', '는', '와', '과',
-        '했다', '한다', '하며', '하여', '해서', '하고', '하니', '하면',
-        '그래서', '그러니', '그러므로', '따라서', '때문에', '왜냐하면',
-        '비해', '보다', '처럼', '같이', '만큼', '대로', '듯이',
-        '점', '면', '측면', '부분', '경우', '상황', '상태', '정도',
-        '이런', '저런', '그런', '어떤', '무슨', '어느', '어떻게',
-        '가능', '불가능', '필요', '불필요', '중요', '사용', '이용',
-        '느낌', '기분', '마음', '생각', '의견', '감정', '인상',
-        '한', '두', '세', '네', '몇', '여러', '많은', '적은',
-        '첫', '둘', '셋', '넷', '첫째', '둘째', '셋째', '마지막',
-        '좀', '꼭', '딱', '막', '참', '진짜', '정말로', '확실히',
-        '거의', '대부분', '대체로', '보통', '일반적', '평균적',
-        '특히', '특별히', '주로', '대개', '대체로', '전반적'
-    }
+    """텍스트에서 핵심 키워드 추출 (키워드 → 빈도 Counter, 빈도 1 제외)
     
-    # 모든 텍스트를 결합하고 키워드 추출
+    워드클라우드, 키워드 배지, 요약 등 한 번의 렌더링에서 여러 번 호출되므로
+    결과를 텍스트 해시 기준으로 메모이즈합니다.
+    """
+    tokenizer = get_tokenizer(KEYWORD_SETTINGS["tokenizer"])
     all_text = ' '.join(texts)
+    key = (tokenizer.name, hashlib.sha1(all_text.encode('utf-8')).hexdigest())
     
-    # 한글만 추출 (영어, 숫자 제외)
-    words = re.findall(r'[가-힣]+', all_text)
-    
-    # 필터링 조건 강화
-    filtered_words = []
-    for word in words:
-        if (len(word) >= 2 and 
-            word not in stopwords and
-            not word.endswith('습니다') and
-            not word.endswith('합니다') and
-            not word.endswith('입니다') and
-            not word.endswith('됩니다') and
-            not word.startswith('있') and
-            not word.startswith('없') and
-            not word.startswith('하') and
-            not word.startswith('되') and
-            not word.startswith('않')):
-            filtered_words.append(word)
+    with _keyword_cache_lock:
+        cached = _KEYWORD_CACHE.get(key)
+        if cached is not None:
+            _KEYWORD_CACHE.move_to_end(key)
+            return Counter(cached)
     
-    # 단어 빈도 계산
-    word_freq = Counter(filtered_words)
+    # 한글 토큰만 사용 (영어, 숫자 제외), 조사/활용 어미는 토크나이저에서 정리
+    word_freq = Counter(
+        word for word in tokenizer(all_text)
+        if len(word) >= 2
+        and word not in KEYWORD_STOPWORDS
+        and not _EXCLUDED_WORD_PATTERN.search(word)
+    )
     
     # 빈도수가 1인 단어는 제외
-    word_freq = {word: freq for word, freq in word_freq.items() if freq > 1}
+    word_freq = Counter({word: freq for word, freq in word_freq.items() if freq > 1})
+    
+    with _keyword_cache_lock:
+        _KEYWORD_CACHE[key] = word_freq
+        if len(_KEYWORD_CACHE) > _KEYWORD_CACHE_SIZE:
+            _KEYWORD_CACHE.popitem(last=False)
+    
+    return Counter(word_freq)
+
+# 제품명 한글 → 영문 별칭 (긴 것부터 매칭)
+PRODUCT_NAME_ALIASES = {
+    '맥북': 'macbook', '갤럭시북': 'galaxybook', '갤럭시': 'galaxy', '아이패드': 'ipad',
+    '씽크패드': 'thinkpad', '씽크북': 'thinkbook', '젠북': 'zenbook', '비보북': 'vivobook',
+    '로그': 'rog', '서피스': 'surface', '그램': 'gram', '프로': 'pro', '에어': 'air',
+    '맥스': 'max', '울트라': 'ultra', '플러스': 'plus', '미니': 'mini', '게이밍': 'gaming',
+    '레노버': 'lenovo', '에이수스': 'asus', '아수스': 'asus', '에이서': 'acer',
+    '삼성': 'samsung', '애플': 'apple', '엘지': 'lg', '레이저': 'razer', '인치': 'inch'
+}
+
+# 다른 단어 일부와 겹치기 쉬운 짧은 별칭은 단어 전체가 일치할 때만 변환
+PRODUCT_NAME_TOKEN_ALIASES = {'델': 'dell', '북': 'book', '에이치피': 'hp'}
+
+_PRODUCT_ALIAS_PATTERN = re.compile(
+    '|'.join(sorted(map(re.escape, PRODUCT_NAME_ALIASES), key=len, reverse=True))
+)
+
+def normalize_product_name(product_name):
+    """제품명 정규화 (캐시/검색 키용)
     
-    return word_freq
+    유니코드 정규화, 소문자화, 한글 별칭의 영문 변환 후 공백과 기호를 제거합니다.
+    예: "맥북프로 M3", "맥북 프로 m3", "MacBook Pro M3" → "macbookprom3"
+    """
+    text = unicodedata.normalize('NFKC', product_name or '').lower()
+    tokens = [PRODUCT_NAME_TOKEN_ALIASES.get(token, token) for token in text.split()]
+    text = _PRODUCT_ALIAS_PATTERN.sub(lambda m: PRODUCT_NAME_ALIASES[m.group(0)], ' '.join(tokens))
+    return re.sub(r'[^0-9a-z가-힣]', '', text)
 
 def generate_coupang_search_link(product_name):
     """쿠팡 검색 링크 생성"""
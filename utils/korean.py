@@ -0,0 +1,123 @@
+"""
+한국어 키워드 토크나이저 (조사/어미 제거, 선택적 형태소 분석기)
+"""
+import re
+from functools import lru_cache
+
+try:
+    from kiwipiepy import Kiwi
+except ImportError:  # 형태소 분석기가 없으면 조사 제거 토크나이저 사용
+    Kiwi = None
+
+_HANGUL_WORD_PATTERN = re.compile(r'[가-힣]+')
+
+# 명사 뒤에 붙어도 명사를 잘못 자를 일이 거의 없는 조사 (긴 것부터)
+_SAFE_JOSA_PATTERN = re.compile(
+    r'(?:에서는|에서도|으로는|으로도|이라서|이라고|이라는|에게서|한테서|'
+    r'에서|에게|한테|으로|까지|부터|처럼|보다|만큼|마저|조차|밖에|이나|이랑|'
+    r'에는|에도|와는|과는|로는|로도|은|는|을|를)$'
+)
+# 명사 끝글자와 겹칠 수 있는 한 글자 조사 ("평가", "디스플레이", "포도")
+_AMBIGUOUS_JOSA_PATTERN = re.compile(r'(?:이|가|의|도|만|와|과|로|에|랑)$')
+# "만족해요", "편리하고" 처럼 명사 + 하다 활용형
+_HADA_ENDING_PATTERN = re.compile(
+    r'(?:했습니다|합니다|했어요|하네요|해요|해서|하고|하게|하다|했다|하며|하면|하지|한|할|함)$'
+)
+
+def _strip(word, pattern):
+    stem = pattern.sub('', word)
+    return stem if len(stem) >= 2 else word
+
+@lru_cache(maxsize=20000)
+def _stem(word):
+    """'하다' 활용 어미와 확실한 조사 제거 (어절별로 한 번만 계산)"""
+    return _strip(_strip(word, _HADA_ENDING_PATTERN), _SAFE_JOSA_PATTERN)
+
+@lru_cache(maxsize=20000)
+def _strip_ambiguous(word):
+    return _strip(word, _AMBIGUOUS_JOSA_PATTERN)
+
+class RegexTokenizer:
+    """한글 어절을 그대로 사용 (기존 방식)"""
+
+    name = "regex"
+
+    def __call__(self, text):
+        return _HANGUL_WORD_PATTERN.findall(text)
+
+class JosaTokenizer:
+    """외부 의존성 없이 조사와 '하다' 활용 어미를 떼어 어절을 줄기로 모음
+
+    "배터리가", "배터리는", "배터리" 를 모두 "배터리" 로 셉니다.
+    명사 끝글자와 겹치는 한 글자 조사는, 뗀 줄기가 같은 텍스트에 따로
+    나올 때만 떼어 "평가" → "평" 같은 오분리를 막습니다.
+    """
+
+    name = "josa"
+
+    def __call__(self, text):
+        words = [_stem(word) for word in _HANGUL_WORD_PATTERN.findall(text)]
+        attested = set(words)
+        tokens = []
+        for word in words:
+            stem = _strip_ambiguous(word)
+            tokens.append(stem if stem != word and stem in attested else word)
+        return tokens
+
+class KiwiTokenizer:
+    """kiwipiepy 형태소 분석기로 명사/어근만 추출"""
+
+    name = "kiwi"
+    TAGS = frozenset({'NNG', 'NNP', 'XR'})
+
+    def __init__(self):
+        self._kiwi = Kiwi()
+
+    def __call__(self, text):
+        return [
+            token.form for token in self._kiwi.tokenize(text)
+            if token.tag in self.TAGS and _HANGUL_WORD_PATTERN.fullmatch(token.form)
+        ]
+
+_TOKENIZERS = {}
+
+def get_tokenizer(name="auto"):
+    """토크나이저 반환 ("auto": kiwipiepy 가 있으면 kiwi, 없으면 josa)"""
+    tokenizer = _TOKENIZERS.get(name)
+    if tokenizer is not None:
+        return tokenizer
+
+    resolved = name
+    if resolved == "auto":
+        resolved = "kiwi" if Kiwi is not None else "josa"
+    if resolved == "kiwi" and Kiwi is None:
+        print("kiwipiepy 가 설치되지 않아 조사 제거 토크나이저를 사용합니다")
+        resolved = "josa"
+
+    tokenizer = _TOKENIZERS.get(resolved)
+    if tokenizer is None:
+        tokenizer = {"regex": RegexTokenizer, "josa": JosaTokenizer, "kiwi": KiwiTokenizer}[resolved]()
+        _TOKENIZERS[resolved] = tokenizer
+    _TOKENIZERS[name] = tokenizer
+    return tokenizer
+
+if __name__ == "__main__":
+    # 간단한 성능 비교: python -m utils.korean
+    import random
+    import timeit
+
+    samples = [
+        "배터리가 오래가서 만족해요", "배터리는 하루 종일 갑니다", "하드웨어 성능이 좋습니다",
+        "화면이 선명하고 밝아요", "발열이 심한 편이에요", "키보드 타건감이 편리하고 좋아요",
+        "가격은 비싼 편입니다", "무게가 가벼워서 휴대하기 좋음", "디스플레이가 선명함", "포트가 부족해요"
+    ]
+    random.seed(0)
+    text = ' '.join(random.choice(samples) for _ in range(60))
+    names = ["regex", "josa"] + (["kiwi"] if Kiwi is not None else [])
+
+    for name in names:
+        tokenizer = get_tokenizer(name)
+        runs = 200
+        seconds = timeit.timeit(lambda: tokenizer(text), number=runs)
+        tokens = tokenizer(text)
+        print(f"{name:6s} {seconds / runs * 1000:.3f} ms/call  고유 토큰 {len(set(tokens))}개")
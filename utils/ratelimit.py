@@ -0,0 +1,67 @@
+"""
+호스트별 요청 속도 제한 (토큰 버킷)
+"""
+import threading
+import time
+
+class TokenBucket:
+    """초당 rate 개씩 채워지고 최대 burst 개까지 쌓이는 토큰 버킷
+
+    토큰이 모자라면 미리 예약(음수 잔량)하고 그만큼 기다리므로, 먼저 요청한
+    스레드부터 차례로 통과하고 전체 속도가 rate 를 넘지 않습니다.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens=1):
+        """토큰을 가져올 수 있을 때까지 대기하고 대기 시간(초)을 반환"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            if wait:
+                self.waits += 1
+                self.wait_seconds += wait
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, seconds):
+        """429 등으로 서버가 요청한 시간만큼 이후 요청을 모두 늦춤"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+class RateLimiters:
+    """호스트 이름 → TokenBucket (프로세스 전체에서 공유)"""
+
+    def __init__(self, limits, default):
+        self.limits = limits
+        self.default = default
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def get(self, host):
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                limit = self.limits.get(host, self.default)
+                bucket = TokenBucket(limit["rate"], limit["burst"])
+                self._buckets[host] = bucket
+            return bucket
+
+    def wait_stats(self):
+        """{호스트: (대기 횟수, 총 대기 시간)}"""
+        with self._lock:
+            return {host: (bucket.waits, bucket.wait_seconds) for host, bucket in self._buckets.items()}
@@ -0,0 +1,106 @@
+"""
+같은 작업의 동시 실행 방지 (single-flight)
+"""
+import hashlib
+import os
+import threading
+import time
+from utils.cache import DiskCache
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """키별로 작업을 한 번만 실행하고 나머지 호출은 그 결과를 공유
+
+    - 같은 프로세스: 먼저 들어온 호출이 실행하고 나머지는 이벤트로 대기
+    - 다른 프로세스: 잠금(lease) 파일을 가진 프로세스만 실행하고,
+      나머지는 잠금이 풀릴 때까지 기다린 뒤 공유 디스크 캐시에서 결과를 읽음
+    - 오래된 잠금(lease_ttl 초과)은 실행 중 프로세스가 죽은 것으로 보고 회수
+    """
+
+    def __init__(self, directory, lease_ttl=180, wait_timeout=120, poll_interval=0.5, result_ttl=60):
+        self.lock_dir = os.path.join(directory, 'locks')
+        self.lease_ttl = lease_ttl
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self.results = DiskCache(os.path.join(directory, 'results'), ttl=result_ttl)
+        self._calls = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.lock_dir, exist_ok=True)
+
+    def do(self, key, fn):
+        """fn() 실행 결과와 다른 호출의 결과를 공유받았는지 여부를 반환"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            if call.done.wait(self.wait_timeout) and call.error is None:
+                return call.result, True
+            return fn(), False
+
+        try:
+            call.result, shared = self._do_across_processes(key, fn)
+            return call.result, shared
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            call.done.set()
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def _lock_path(self, key):
+        digest = hashlib.sha256(str(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.lock_dir, f"{digest}.lock")
+
+    def _acquire(self, path):
+        """잠금 파일 생성 시도 (오래된 잠금은 회수)"""
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(path) > self.lease_ttl:
+                    os.remove(path)
+                    return self._acquire(path)
+            except OSError:
+                pass
+            return False
+        with os.fdopen(fd, 'w') as f:
+            f.write(f"{os.getpid()} {time.time()}")
+        return True
+
+    def _release(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _do_across_processes(self, key, fn):
+        path = self._lock_path(key)
+        deadline = time.time() + self.wait_timeout
+
+        while not self._acquire(path):
+            # 다른 프로세스가 실행 중: 잠금이 풀리면 결과를 공유받음
+            while os.path.exists(path) and time.time() < deadline:
+                time.sleep(self.poll_interval)
+
+            result = self.results.get(key)
+            if result is not None:
+                return result, True
+            if time.time() >= deadline:
+                return fn(), False
+
+        try:
+            result = fn()
+            if result is not None:
+                self.results.set(key, result)
+            return result, False
+        finally:
+            self._release(path)